@@ -1,35 +1,28 @@
 import os
+import re
 
 from datetime import datetime
+from pathlib import Path
 
 VNS = '__version__'
 VDS = '__versiondate__'
-EQS = ' = "'
-NLS = '"\n'
 
 
 def bump_version():
 
     fname = os.path.join('rastertools', 'version.py')
 
-    with open(fname) as fid01:
-        flines = fid01.readlines()
-
-    with open(fname, 'w') as fid02:
-        for lval in flines:
-            if (lval.startswith(VDS)):
-                dval = datetime.today().strftime('%Y-%m-%d')
-                nline = VDS + EQS + dval + NLS
-                fid02.write(nline)
-            elif (lval.startswith(VNS)):
-                ver = lval.split('"')[1]
-                vnum = ver.split('.')
-                nver = vnum[0] + '.' + vnum[1] + '.'
-                nver = nver + str(int(vnum[2]) + 1)
-                nline = VNS + EQS + nver + NLS
-                fid02.write(nline)
-            else:
-                fid02.write(lval)
+    text = Path(fname).read_text()
+
+    dval = datetime.today().strftime('%Y-%m-%d')
+    text = re.sub(r'^(' + VDS + r' = )"[^"]*"$',
+                  lambda m: m.group(1) + '"' + dval + '"',
+                  text, flags=re.M)
+    text = re.sub(r'^(' + VNS + r' = )"(\d+)\.(\d+)\.(\d+)"$',
+                  lambda m: '{}"{}.{}.{}"'.format(m.group(1), m.group(2), m.group(3), int(m.group(4)) + 1),
+                  text, flags=re.M)
+
+    Path(fname).write_text(text)
 
     return None
 
@@ -0,0 +1,184 @@
+"""
+Numeric kernels JIT-compiled with numba (optional dependency).
+
+This module is imported on first use of a kernel, so importing the package doesn't import numba
+or compile anything; kernels are compiled lazily and cached on disk.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, fastmath=True)
+def area_sphere_jit(shape_points):
+    """Scalar-loop version of `area_sphere` compiled with numba."""
+    tarea = 0.0
+    for i in range(shape_points.shape[0] - 1):
+        beta1 = np.radians(shape_points[i, 1])
+        beta2 = np.radians(shape_points[i + 1, 1])
+        domeg = np.radians(shape_points[i + 1, 0] - shape_points[i, 0])
+        val1 = (
+            np.tan(domeg / 2)
+            * np.sin((beta2 + beta1) / 2.0)
+            * np.cos((beta2 - beta1) / 2.0)
+        )
+        tarea += 2.0 * np.arctan(val1)
+
+    return 6371.0 * 6371.0 * tarea
+
+
+@numba.njit(cache=True)
+def centroid_area_jit(shape_points):
+    """Scalar-loop version of `centroid_area` compiled with numba (no fastmath, terms cancel out)."""
+    A = Sx = Sy = 0.0
+    for i in range(shape_points.shape[0] - 1):
+        x1, y1 = shape_points[i, 0], shape_points[i, 1]
+        x2, y2 = shape_points[i + 1, 0], shape_points[i + 1, 1]
+        a = x1 * y2 - x2 * y1
+        A += a
+        Sx += (x1 + x2) * a
+        Sy += (y1 + y2) * a
+
+    return Sx / (3.0 * A), Sy / (3.0 * A), A / 2.0
+
+
+# Numpy error model: empty (zero area) parts give nan/inf centroids, as in the numpy version
+@numba.njit(cache=True, nogil=True, error_model="numpy")
+def parts_area_centroid_jit(points, part_offsets):
+    """Single-kernel version of `parts_area_centroid`, one scalar loop per part."""
+    n_parts = part_offsets.shape[0] - 1
+    areas = np.zeros(n_parts)
+    Cx = np.zeros(n_parts)
+    Cy = np.zeros(n_parts)
+    Axy = np.zeros(n_parts)
+    for k in range(n_parts):
+        tarea = A = Sx = Sy = 0.0
+        for i in range(part_offsets[k], part_offsets[k + 1] - 1):
+            x1, y1 = points[i, 0], points[i, 1]
+            x2, y2 = points[i + 1, 0], points[i + 1, 1]
+
+            # Spherical area, see area_sphere
+            beta1 = np.radians(y1)
+            beta2 = np.radians(y2)
+            domeg = np.radians(x2 - x1)
+            val1 = (
+                np.tan(domeg / 2)
+                * np.sin((beta2 + beta1) / 2.0)
+                * np.cos((beta2 - beta1) / 2.0)
+            )
+            tarea += 2.0 * np.arctan(val1)
+
+            # Area centroid, see centroid_area
+            a = x1 * y2 - x2 * y1
+            A += a
+            Sx += (x1 + x2) * a
+            Sy += (y1 + y2) * a
+
+        areas[k] = 6371.0 * 6371.0 * tarea
+        Axy[k] = A / 2.0
+        Cx[k] = Sx / (3.0 * A)
+        Cy[k] = Sy / (3.0 * A)
+
+    return areas, Cx, Cy, Axy
+
+
+@numba.njit(cache=True, nogil=True)
+def ring_box_jit(ring_xy, ring_offsets):
+    """Per-ring (y_min, y_max, x_max) bounds, used to skip rings a point's ray cannot cross."""
+    ring_box = np.empty((ring_offsets.shape[0] - 1, 3), dtype=np.float64)
+    for r in range(ring_offsets.shape[0] - 1):
+        y_min, y_max, x_max = np.inf, -np.inf, -np.inf
+        for k in range(ring_offsets[r], ring_offsets[r + 1]):
+            y_min = min(y_min, ring_xy[k, 1])
+            y_max = max(y_max, ring_xy[k, 1])
+            x_max = max(x_max, ring_xy[k, 0])
+        ring_box[r, 0] = y_min
+        ring_box[r, 1] = y_max
+        ring_box[r, 2] = x_max
+    return ring_box
+
+
+@numba.njit(cache=True, nogil=True, inline="always")
+def point_in_rings_jit(x, y, ring_xy, ring_offsets, ring_box, ring_positive):
+    """Crossing-number test of a single point, union of positive rings minus holes (in ring order)."""
+    c = False
+    for r in range(ring_offsets.shape[0] - 1):
+        # Skip rings that can't change the result: positive rings when the point is already
+        # inside, holes when it is outside
+        if c == ring_positive[r]:
+            continue
+        # Early exit: the ray to +x can't cross a ring outside the point's row or left of it
+        if y < ring_box[r, 0] or y >= ring_box[r, 1] or x > ring_box[r, 2]:
+            continue
+        ring_in = False
+        j = ring_offsets[r + 1] - 1
+        for k in range(ring_offsets[r], ring_offsets[r + 1]):
+            yk = ring_xy[k, 1]
+            yj = ring_xy[j, 1]
+            if (yk > y) != (yj > y):
+                dx = ring_xy[j, 0] - ring_xy[k, 0]
+                x_cross = ring_xy[k, 0] + dx * (y - yk) / (yj - yk)
+                if x < x_cross:
+                    ring_in = not ring_in
+            j = k
+        if ring_in:
+            c = ring_positive[r]
+    return c
+
+
+# Serial kernel releasing the GIL: callers already run shapes in a thread pool
+@numba.njit(cache=True, nogil=True)
+def rings_contain_jit(ring_xy, ring_offsets, ring_positive, points):
+    """Crossing-number test of points against a set of positive rings and holes."""
+    ring_box = ring_box_jit(ring_xy, ring_offsets)
+    inside = np.zeros(points.shape[0], dtype=np.bool_)
+    for i in range(points.shape[0]):
+        inside[i] = point_in_rings_jit(
+            points[i, 0], points[i, 1], ring_xy, ring_offsets, ring_box, ring_positive
+        )
+
+    return inside
+
+
+@numba.njit(cache=True, nogil=True)
+def clip_interior_jit(lon, lat, xy_min, xy_max, ring_xy, ring_offsets, ring_positive):
+    """Fused bounding box and crossing-number test, without temporary boolean arrays."""
+    ring_box = ring_box_jit(ring_xy, ring_offsets)
+    index = np.empty(lon.shape[0], dtype=np.int64)
+    count = 0
+    box_count = 0
+    for i in range(lon.shape[0]):
+        x = lon[i]
+        y = lat[i]
+        if x <= xy_min[0] or y <= xy_min[1] or x >= xy_max[0] or y >= xy_max[1]:
+            continue
+        box_count += 1
+        if point_in_rings_jit(x, y, ring_xy, ring_offsets, ring_box, ring_positive):
+            index[count] = i
+            count += 1
+
+    return index[:count], box_count
+
+
+@numba.njit(cache=True, nogil=True)
+def sparce_jit(dat_mat, lon_axis, lat_axis):
+    """Gathers pixel centers and values > 0 in raster (row-major) order."""
+    n = 0
+    for i in range(dat_mat.shape[0]):
+        for j in range(dat_mat.shape[1]):
+            if dat_mat[i, j] > 0:
+                n += 1
+
+    lon = np.empty(n, dtype=lon_axis.dtype)
+    lat = np.empty(n, dtype=lat_axis.dtype)
+    val = np.empty(n, dtype=dat_mat.dtype)
+    k = 0
+    for i in range(dat_mat.shape[0]):
+        for j in range(dat_mat.shape[1]):
+            if dat_mat[i, j] > 0:
+                lon[k] = lon_axis[j]
+                lat[k] = lat_axis[i]
+                val[k] = dat_mat[i, j]
+                k += 1
+
+    return lon, lat, val
@@ -2,8 +2,9 @@
 Functions for spatial processing of raster TIFF files.
 """
 
+from __future__ import annotations
+
 import numpy as np
-import os
 
 from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
@@ -11,12 +12,63 @@ from PIL.TiffTags import TAGS
 from scipy import interpolate
 from pathlib import Path
 from typing import Any, Union, Callable
-from rastertools.shape import ShapeView
+from rastertools.shape import ShapeView, rings_contain_points
+from rastertools.utils import cpu_workers, jit_kernels
+
+
+class SparceData:
+    """Raster pixels with values > 0, stored as separate (structure-of-arrays) lon, lat and value arrays."""
+
+    def __init__(
+        self,
+        lon: np.ndarray,
+        lat: np.ndarray,
+        val: np.ndarray,
+        lat_descending: bool = None,
+    ):
+        self.lon: np.ndarray = np.ascontiguousarray(lon)
+        self.lat: np.ndarray = np.ascontiguousarray(lat)
+        self.val: np.ndarray = np.ascontiguousarray(val)
+        self._lonlat: np.ndarray = None
+        self._lat_key: np.ndarray = None
+
+        # Raster rows are scanned top to bottom, so latitude is typically already sorted
+        if lat_descending is None:
+            lat_descending = bool(np.all(self.lat[1:] <= self.lat[:-1]))
+        self.lat_descending: bool = lat_descending
+
+    def __len__(self):
+        return self.val.shape[0]
+
+    def lat_band(self, lat_min: float, lat_max: float) -> slice:
+        """Slice of rows with lat_min < lat < lat_max (binary search, descending latitude only)."""
+        assert self.lat_descending, "Data must be sorted by descending latitude."
+        if self._lat_key is None:
+            self._lat_key = -self.lat  # ascending search key
+        lo = np.searchsorted(self._lat_key, -lat_max, side="right")
+        hi = np.searchsorted(self._lat_key, -lat_min, side="left")
+        return slice(lo, max(lo, hi))
+
+    @property
+    def lonlat(self) -> np.ndarray:
+        """Contiguous (N,2) array of lon/lat coordinates, e.g. for point-in-polygon tests."""
+        if self._lonlat is None:
+            self._lonlat = np.column_stack([self.lon, self.lat])
+        return self._lonlat
+
+    def subset(self, index: np.ndarray) -> SparceData:
+        """Subset of the data selected by a boolean mask, a slice or a sorted integer index."""
+        return SparceData(
+            self.lon[index],
+            self.lat[index],
+            self.val[index],
+            lat_descending=self.lat_descending,
+        )
 
 
 def raster_clip(
     raster_file: Union[str, Path],
-    shape_stem: Union[str, Path],
+    shape_stem: Union[str, Path, list[ShapeView]],
     shape_attr: str = "DOTNAME",
     summary_func: Callable = None,
     include_latlon: bool = False,
@@ -27,7 +79,8 @@ def raster_clip(
 
     Args:
         raster_file (str): Local path to a raster file.
-        shape_stem (str): Local path stem referencing a set of shape files.
+        shape_stem (str): Local path stem referencing a set of shape files, or a list of already
+            loaded `ShapeView` objects (reused as-is, e.g. when clipping many rasters with the same shapes).
         shape_attr (str): The shape attribute name to be used as the output dictionary key.
         summary_func (Callable): Aggregation function to be used for summarizing clipped data for each shape.
         include_latlon (bool, optional): Flag to include lat/lon in the dictionary entry. Defaults to False.
@@ -41,18 +94,21 @@ def raster_clip(
     print("Loading data...")
 
     # Load data, init sparce matrix
-    shapes = ShapeView.from_file(shape_stem, shape_attr)
-    raster = Image.open(raster_file)
-    sparce_data = init_sparce_matrix(raster)
+    shapes = load_shapes(shape_stem, shape_attr)
+    with Image.open(raster_file) as raster:
+        sparce_data = init_sparce_matrix(raster, bounds=shapes_bounds(shapes))
 
     # Output dictionary
     data_dict = dict()
     shape_len = len(shapes)
     print("Clipping:")
 
+    # Resolve the aggregation function once for all shapes
+    summary_func = summary_func or default_summary_func
+
     fts = {}
     # Init the futures executor
-    executor = ThreadPoolExecutor(max_workers=(os.cpu_count() - 1))
+    executor = ThreadPoolExecutor(max_workers=cpu_workers())
 
     # Iterate over shapes in shapefile
     for k1, shp in enumerate(shapes):
@@ -60,65 +116,54 @@ def raster_clip(
             raster_clip_single,
             shp=shp,
             sparce_data=sparce_data,
-            k1=k1,
-            shape_len=shape_len,
             summary_func=summary_func,
             include_latlon=include_latlon,
-            quiet=quiet,
         )
 
+    # Collect results in shape order; status is printed here, not from worker threads
     data_dict = {}
     for k1, ft in fts.items():
         data_dict.update(ft.result())
+        if not quiet or k1 % 1000 == 0 or k1 in [0, shape_len - 1]:
+            print_status(shapes[k1], data_dict, k1, shape_len)
 
     executor.shutdown(wait=True)
 
     return data_dict
 
 
-def raster_clip_single(
-    shp, sparce_data, k1, shape_len, summary_func, include_latlon, quiet
-):
+def raster_clip_single(shp, sparce_data, summary_func, include_latlon):
     """
     Extracts data from a raster based on shapes.
 
     Args:
         shp (ShapeView): Shape object.
-        sparce_data (np.ndarray): Sparce matrix of raster data.
-        k1 (int): Index of the shape.
-        shape_len (int): Total number of shapes.
+        sparce_data (SparceData): Sparce raster data.
         summary_func (Callable): Aggregation function to be used for summarizing clipped data for each shape.
         include_latlon (bool): Flag to include lat/lon in the dictionary entry.
-        quiet (bool): Flag to control whether status messages are printed.
 
     Returns:
         dict: A dictionary with dot names as keys and calculated aggregations as values.
     """
     data_dict = {}
-    show_status = not quiet or k1 % 1000 == 0 or k1 in [0, shape_len - 1]
     # Null shape; error in shapefile
     shp.validate()
 
-    # Subset population data matrix for clipping
-    data_clip = subset_matrix_for_clipping(shp, sparce_data)
+    # Indices of points interior to the shape (and number of points in its bounding box)
+    index, box_count = clip_interior_index(shp, sparce_data)
 
-    if data_clip.shape[0] == 0:
+    if box_count == 0:
         data_dict[shp.name] = summary_entry(shp, {"pop": 0}, include_latlon)
-        if show_status:
-            print_status(shp, data_dict, k1, shape_len)
         return data_dict
 
     # Pop values
-    value = data_clip[is_interior(shp, data_clip), 2]
+    value = sparce_data.val[index]
 
     # Entry dictionary
-    summary_func = summary_func or default_summary_func
     entry = {"pop": summary_func(value)}
 
-    # Set entry and print status
+    # Set entry
     data_dict[shp.name] = summary_entry(shp, entry, include_latlon)
-    if show_status:
-        print_status(shp, data_dict, k1, shape_len)
 
     return data_dict
 
@@ -126,10 +171,11 @@ def raster_clip_single(
 def raster_clip_weighted(
     raster_weight: Union[str, Path],
     raster_value: Union[str, Path],
-    shape_stem: Union[str, Path],
+    shape_stem: Union[str, Path, list[ShapeView]],
     shape_attr: str = "DOTNAME",
     weight_summary_func: Callable = None,
     include_latlon: bool = False,
+    quiet: bool = False,
 ) -> dict[str, Union[float, int]]:
     """
     Extracts data from a raster based on shapes.
@@ -137,10 +183,12 @@ def raster_clip_weighted(
     Args:
         raster_weight (str): Local path to a raster file used for weights.
         raster_value (str): Local path to a raster file used for values.
-        shape_stem (str): Local path stem referencing a set of shape files.
+        shape_stem (str): Local path stem referencing a set of shape files, or a list of already
+            loaded `ShapeView` objects (reused as-is, e.g. when clipping many rasters with the same shapes).
         shape_attr (str): The shape attribute name to be used as the output dictionary key.
         weight_summary_func (Callable): Aggregation function to be used for summarizing clipped data for each shape.
         include_latlon (bool, optional): Flag to include lat/lon in the dictionary entry. Defaults to False.
+        quiet (bool, optional): Flag to control whether status messages are printed. Defaults to False.
 
     Returns:
         dict: A dictionary with dot names as keys and calculated aggregations as values.
@@ -148,47 +196,110 @@ def raster_clip_weighted(
     assert Path(raster_weight).is_file(), "Population raster file not found."
     assert Path(raster_value).is_file(), "Values raster file not found."
 
-    # Load data shape and rasters
-    shapes = ShapeView.from_file(shape_stem, shape_attr)
-    raster_weights = Image.open(raster_weight)
-    raster_values = Image.open(raster_value)
-
-    # Init sparce matrices
-    sparce_pop = init_sparce_matrix(raster_weights)
-    sparce_val = init_sparce_matrix(raster_values)
+    # Load data shapes
+    shapes = load_shapes(shape_stem, shape_attr)
+    # Init sparce matrices, one raster at a time (decoded pixels are released once the raster is closed)
+    # Only pixels within the shapes' extent are kept (values are clipped with a 1 degree pad)
+    with Image.open(raster_weight) as raster_weights:
+        sparce_pop = init_sparce_matrix(raster_weights, bounds=shapes_bounds(shapes))
+    with Image.open(raster_value) as raster_values:
+        sparce_val = init_sparce_matrix(raster_values, bounds=shapes_bounds(shapes, pad=1))
 
     # Output dictionary
-    data_dict = dict()
+    shape_len = len(shapes)
+
+    # Resolve the aggregation function once for all shapes
+    weight_summary_func = weight_summary_func or default_summary_func
+
+    fts = {}
+    # Init the futures executor
+    executor = ThreadPoolExecutor(max_workers=cpu_workers())
 
     # Iterate over shapes in shapefile
     for k1, shp in enumerate(shapes):
-        # Null shape; error in shapefile
-        shp.validate()
+        fts[k1] = executor.submit(
+            raster_clip_weighted_single,
+            shp=shp,
+            sparce_pop=sparce_pop,
+            sparce_val=sparce_val,
+            weight_summary_func=weight_summary_func,
+            include_latlon=include_latlon,
+        )
 
-        # Subset matrices for clipping
-        pop_clip = subset_matrix_for_clipping(shape=shp, sparce_data=sparce_pop)
-        val_clip = subset_matrix_for_clipping(shape=shp, sparce_data=sparce_val, pad=1)
+    # Collect results in shape order; status is printed here, not from worker threads
+    data_dict = {}
+    for k1, ft in fts.items():
+        data_dict.update(ft.result())
+        if not quiet or k1 % 1000 == 0 or k1 in [0, shape_len - 1]:
+            print_status(shapes[k1], data_dict, k1, shape_len)
 
-        # Track booleans (indicates if lat/long is interior)
-        data_bool = is_interior(shp, pop_clip)
+    executor.shutdown(wait=True)
 
-        # Interpolate at population data
-        final_val = interpolate_at_weight_data(shp, pop_clip, val_clip, data_bool)
+    return data_dict
 
-        # Pop values
-        values = pop_clip[data_bool, 2]
 
-        # Entry dictionary
-        weight_summary_func = weight_summary_func or default_summary_func
-        entry = {"pop": weight_summary_func(values), "val": final_val}
+def raster_clip_weighted_single(
+    shp, sparce_pop, sparce_val, weight_summary_func, include_latlon
+):
+    """
+    Extracts weighted data from rasters for a single shape.
 
-        # Set entry and print status
-        data_dict[shp.name] = summary_entry(shp, entry, include_latlon)
-        print_status(shp, data_dict, k1, len(shapes))
+    Args:
+        shp (ShapeView): Shape object.
+        sparce_pop (SparceData): Sparce weight raster data.
+        sparce_val (SparceData): Sparce value raster data.
+        weight_summary_func (Callable): Aggregation function to be used for summarizing clipped data for each shape.
+        include_latlon (bool): Flag to include lat/lon in the dictionary entry.
+
+    Returns:
+        dict: A dictionary with dot names as keys and calculated aggregations as values.
+    """
+    data_dict = {}
+    # Null shape; error in shapefile
+    shp.validate()
+
+    # Subset matrices for clipping
+    pop_clip = subset_matrix_for_clipping(shape=shp, sparce_data=sparce_pop)
+    val_clip = subset_matrix_for_clipping(shape=shp, sparce_data=sparce_val, pad=1)
+
+    # Indices of interior points (integer gathers are cheaper than boolean masks for sparse hits)
+    data_index = np.flatnonzero(is_interior(shp, pop_clip))
+
+    # Interpolate at population data
+    final_val = interpolate_at_weight_data(shp, pop_clip, val_clip, data_index)
+
+    # Pop values
+    values = pop_clip.val[data_index]
+
+    # Entry dictionary
+    entry = {"pop": weight_summary_func(values), "val": final_val}
+
+    # Set entry
+    data_dict[shp.name] = summary_entry(shp, entry, include_latlon)
 
     return data_dict
 
 
+def load_shapes(
+    shape_stem: Union[str, Path, list[ShapeView]], shape_attr: str = None
+) -> list[ShapeView]:
+    """
+    Loads shape views from a shape file, or passes through already loaded shape views.
+
+    Args:
+        shape_stem (str): Local path stem referencing a set of shape files, or a list of `ShapeView` objects.
+        shape_attr (str): The shape attribute name to be used as the output dictionary key.
+
+    Returns:
+        list: A list of `ShapeView` objects, with precomputed part areas and centers.
+    """
+    if isinstance(shape_stem, (list, tuple)):
+        assert all(isinstance(s, ShapeView) for s in shape_stem), "Expected a list of ShapeView objects."
+        return list(shape_stem)
+
+    return ShapeView.from_file(shape_stem, shape_attr)
+
+
 def default_summary_func(v: np.ndarray) -> int:
     """Sum an array and round to the nearest integer."""
     return int(np.round(np.sum(v), 0))
@@ -237,51 +348,166 @@ def extract_xy_info_from_raster(raster: Image) -> tuple[float, float, float, flo
     return x0, y0, dx, dy
 
 
-def init_sparce_matrix(raster: Image) -> np.ndarray:
-    """Initialize a matrix from a raster TIFF file with values > 0"""
+def shapes_bounds(shapes: list[ShapeView], pad: int = 0) -> Union[tuple[float, float, float, float], None]:
+    """
+    Combined (padded) bounding box of shapes.
+
+    Args:
+        shapes (list[ShapeView]): Shape objects.
+        pad (int): Padding added to each side of the bounding box.
+
+    Returns:
+        tuple: A tuple of x_min, y_min, x_max, y_max, or None if there are no shapes with points.
+    """
+    shapes = [s for s in shapes if s.points.shape[0] > 0]
+    if len(shapes) == 0:
+        return None
+
+    xy_min = np.min([s.xy_min for s in shapes], axis=0) - pad
+    xy_max = np.max([s.xy_max for s in shapes], axis=0) + pad
+    return xy_min[0], xy_min[1], xy_max[0], xy_max[1]
+
+
+def axis_window(axis: np.ndarray, v_min: float, v_max: float) -> slice:
+    """Slice of pixel centers within (v_min, v_max), widened by one pixel on each side."""
+    index = np.flatnonzero((axis > v_min) & (axis < v_max))
+    if len(index) == 0:
+        return slice(0, 0)
+    return slice(max(index[0] - 1, 0), index[-1] + 2)
+
+
+def init_sparce_matrix(raster: Image, bounds: tuple[float, float, float, float] = None) -> SparceData:
+    """
+    Initialize sparce data (lon, lat, value) from a raster TIFF file with values > 0.
+
+    Args:
+        raster (TIFF): TIFF object.
+        bounds (tuple, optional): Bounding box (x_min, y_min, x_max, y_max) of the pixels to keep.
+            Defaults to the whole raster.
+
+    Returns:
+        SparceData: Sparce data with pixels in raster (row-major) order.
+    """
 
     # Extract data from raster
     x0, y0, dx, dy = extract_xy_info_from_raster(raster)
 
-    dat_mat = np.array(raster)
-    xy_ints = np.argwhere(dat_mat > 0)
-    sparce_data = np.zeros((xy_ints.shape[0], 3), dtype=float)
+    dat_mat = np.asarray(raster)
+
+    # Pixel center coordinates, computed once per raster column/row
+    lon_axis = x0 + dx * np.arange(dat_mat.shape[1]) + dx / 2.0
+    lat_axis = y0 + dy * np.arange(dat_mat.shape[0]) + dy / 2.0
+
+    # Only scan the window of the raster covering the bounding box
+    if bounds is not None:
+        col_win = axis_window(lon_axis, bounds[0], bounds[2])
+        row_win = axis_window(lat_axis, bounds[1], bounds[3])
+        dat_mat = dat_mat[row_win, col_win]
+        lon_axis = lon_axis[col_win]
+        lat_axis = lat_axis[row_win]
 
-    # Construct sparce matrix of (long, lat, data)
-    sparce_data[:, 0] = x0 + dx * xy_ints[:, 1] + dx / 2.0
-    sparce_data[:, 1] = y0 + dy * xy_ints[:, 0] + dy / 2.0
-    sparce_data[:, 2] = dat_mat[xy_ints[:, 0], xy_ints[:, 1]]
+    kernels = jit_kernels()
+    if kernels is not None and dat_mat.dtype.isnative:
+        # Single pass over the raster, no mask or index temporaries
+        lon, lat, val = kernels.sparce_jit(np.ascontiguousarray(dat_mat), lon_axis, lat_axis)
+    else:
+        mask = dat_mat > 0
+        rows, cols = np.nonzero(mask)
+        lon, lat, val = lon_axis[cols], lat_axis[rows], dat_mat[mask]
+
+    # Integer rasters keep their dtype (exact integer sums); floats are summed in double precision
+    if not np.issubdtype(val.dtype, np.integer):
+        val = val.astype(np.float64)
+
+    # Construct sparce data of (long, lat, data)
+    sparce_data = SparceData(lon=lon, lat=lat, val=val)
 
     return sparce_data
 
 
+def clipping_band(shape: ShapeView, sparce_data: SparceData, pad: int = 0) -> slice:
+    """Slice of sparce data rows to be scanned for clipping (the shape's latitude band, if available)."""
+    if sparce_data.lat_descending:
+        return sparce_data.lat_band(shape.xy_min[1] - pad, shape.xy_max[1] + pad)
+    return slice(0, len(sparce_data))
+
+
+def clipping_index(shape: ShapeView, sparce_data: SparceData, pad: int = 0) -> np.ndarray:
+    """
+    Indices of sparce data points inside the shape's (padded) bounding box.
+
+    Args:
+        shape (ShapeView): Shape object.
+        sparce_data (SparceData): Sparce raster data.
+        pad (int): Padding for clipping.
+
+    Returns:
+        np.ndarray: Sorted indices of points inside the bounding box.
+    """
+    band = clipping_band(shape, sparce_data, pad)
+    lon, lat = sparce_data.lon[band], sparce_data.lat[band]
+
+    # In-place compare-and-AND into a single mask, reusing one scratch array
+    clip_bool = np.greater(lon, shape.xy_min[0] - pad)
+    scratch = np.empty_like(clip_bool)
+    clip_bool &= np.greater(lat, shape.xy_min[1] - pad, out=scratch)
+    clip_bool &= np.less(lon, shape.xy_max[0] + pad, out=scratch)
+    clip_bool &= np.less(lat, shape.xy_max[1] + pad, out=scratch)
+
+    return band.start + np.flatnonzero(clip_bool)
+
+
 def subset_matrix_for_clipping(
-    shape: ShapeView, sparce_data: np.ndarray, pad: int = 0
-) -> np.ndarray:
+    shape: ShapeView, sparce_data: SparceData, pad: int = 0
+) -> SparceData:
     """
     Subset the matrix for clipping
 
     Args:
         shape (ShapeView): Shape object.
-        sparce_data (np.ndarray): Sparce matrix of raster data.
+        sparce_data (SparceData): Sparce raster data.
         pad (int): Padding for clipping.
 
     Returns:
-        np.ndarray: A subset of the matrix for clipping.
+        SparceData: A subset of the data for clipping.
     """
-    clip_bool1 = np.logical_and(
-        sparce_data[:, 0] > shape.xy_min[0] - pad,
-        sparce_data[:, 1] > shape.xy_min[1] - pad,
-    )
-    clip_bool2 = np.logical_and(
-        sparce_data[:, 0] < shape.xy_max[0] + pad,
-        sparce_data[:, 1] < shape.xy_max[1] + pad,
-    )
-    data_clip = sparce_data[np.logical_and(clip_bool1, clip_bool2), :]
+    data_clip = sparce_data.subset(clipping_index(shape, sparce_data, pad))
 
     return data_clip
 
 
+def clip_interior_index(shape: ShapeView, sparce_data: SparceData) -> tuple[np.ndarray, int]:
+    """
+    Indices of sparce data points interior to the shape.
+
+    Args:
+        shape (ShapeView): Shape object.
+        sparce_data (SparceData): Sparce raster data.
+
+    Returns:
+        tuple[np.ndarray, int]: Sorted indices of interior points and the number of points
+            inside the shape's bounding box.
+    """
+    kernels = jit_kernels()
+    if kernels is not None:
+        # Fused bounding box and point-in-polygon scan over the latitude band
+        band = clipping_band(shape, sparce_data)
+        index, box_count = kernels.clip_interior_jit(
+            sparce_data.lon[band],
+            sparce_data.lat[band],
+            shape.xy_min,
+            shape.xy_max,
+            shape.points,
+            shape.part_offsets,
+            shape.positive_parts,
+        )
+        return band.start + index, box_count
+
+    box_index = clipping_index(shape, sparce_data)
+    data_bool = is_interior(shape, sparce_data.subset(box_index))
+    return box_index[data_bool], len(box_index)
+
+
 def summary_entry(
     shape: ShapeView, entry: Union[dict, float, int], include_latlon: bool
 ) -> Union[dict, float, int]:
@@ -311,31 +537,22 @@ def summary_entry(
     return final_entry
 
 
-def is_interior(shape: ShapeView, data_clip: np.ndarray) -> bool:
+def is_interior(shape: ShapeView, data_clip: SparceData) -> bool:
     """
     Check if the data is interior to the shape.
 
     Args:
         shape (ShapeView): Shape object.
-        data_clip (np.ndarray): Clipped data.
+        data_clip (SparceData): Clipped data.
 
     Returns:
         bool: True if the data is interior to the shape.
     """
-    # Track booleans (indicates if lat/long is interior)
-    data_bool = np.zeros(data_clip.shape[0], dtype=bool)
-
-    # Iterate over parts of shapefile
-    for path_shp, area_prt in zip(shape.paths, shape.areas):
-        # Union of positive areas; intersection with negative areas
-        if area_prt > 0:
-            data_bool = np.logical_or(
-                data_bool, path_shp.contains_points(data_clip[:, :2])
-            )
-        else:
-            data_bool = np.logical_and(
-                data_bool, np.logical_not(path_shp.contains_points(data_clip[:, :2]))
-            )
+    # Track booleans (indicates if lat/long is interior). All parts are tested in a single pass:
+    # union of positive areas; intersection with negative areas (in part order).
+    data_bool = rings_contain_points(
+        shape.points, shape.part_offsets, shape.positive_parts, data_clip.lonlat
+    )
 
     return data_bool
 
@@ -354,50 +571,57 @@ def print_status(shape: ShapeView, data_dict: dict, k1: int, shape_count: int) -
     )
 
 
+def interpolate_values(value_clip: SparceData, xy: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolates values at given points, using the nearest value where linear interpolation fails.
+
+    Args:
+        value_clip (SparceData): Clipped value data.
+        xy (np.ndarray): A (N,2) array of points to interpolate at.
+
+    Returns:
+        np.ndarray: Interpolated values.
+    """
+    # A single triangulation of the value points, assign -1 for problems
+    linear = interpolate.LinearNDInterpolator(value_clip.lonlat, value_clip.val, fill_value=-1)
+    val_est = linear(xy)
+
+    err_dex = val_est == -1
+    if np.any(err_dex):
+        # Use the nearest value for problems (KD-tree lookup, no triangulation)
+        nearest = interpolate.NearestNDInterpolator(value_clip.lonlat, value_clip.val)
+        val_est[err_dex] = nearest(xy[err_dex])
+
+    return val_est
+
+
 def interpolate_at_weight_data(
-    shape: ShapeView, weight_clip: np.ndarray, value_clip: np.ndarray, data_bool: bool
+    shape: ShapeView, weight_clip: SparceData, value_clip: SparceData, data_bool: np.ndarray
 ) -> float:
     """
     Interpolate at weight data.
 
     Args:
         shape (ShapeView): Shape object.
-        weight_clip (np.ndarray): Clipped weight data.
-        value_clip (np.ndarray): Clipped value data.
-        data_bool (bool): Boolean indicating if the data is interior to the shape.
+        weight_clip (SparceData): Clipped weight data.
+        value_clip (SparceData): Clipped value data.
+        data_bool (np.ndarray): Boolean mask or indices of weight data interior to the shape.
 
     Returns:
         float: The interpolated value at weight data.
     """
     # Calculate population weighted value
-    weight = np.sum(weight_clip[data_bool, 2])
-
-    # Prep interpolate coordinates and value arguments
-    value_args = [value_clip[:, 0:2], value_clip[:, 2]]
+    weight_vals = weight_clip.val[data_bool]
+    weight = np.sum(weight_vals)
 
     if weight > 0:
-        # Interpolate at weight, assign -1 for problems
-        val_est = interpolate.griddata(*value_args, weight_clip[:, 0:2], fill_value=-1)
-        if -1 in val_est:
-            err_dex = val_est == -1
-            # Use the nearest value for problems
-            val_rev = interpolate.griddata(
-                *value_args, weight_clip[err_dex, 0:2], method="nearest"
-            )
-            val_est[err_dex] = val_rev
+        # Interpolate only at interior weight points, the others don't contribute
+        val_est = interpolate_values(value_clip, weight_clip.lonlat[data_bool])
         # Use population to weight values
-        final_val = np.sum(weight_clip[data_bool, 2] * val_est[data_bool]) / weight
+        final_val = np.sum(weight_vals * val_est) / weight
     else:
-        # No population data, interpolate at boundary, assign -1 for problems
-        val_est = interpolate.griddata(*value_args, shape.points[:, 0:2], fill_value=-1)
-        if -1 in val_est:
-            err_dex = val_est == -1
-            # Use the nearest value for problems
-            val_rev = interpolate.griddata(
-                *value_args, shape.points[err_dex, 0:2], method="nearest"
-            )
-            val_est[err_dex] = val_rev
-
+        # No population data, interpolate at boundary
+        val_est = interpolate_values(value_clip, shape.points[:, 0:2])
         # Average values at shape perimeter
         final_val = np.mean(val_est)
 
@@ -4,22 +4,25 @@ Functions for spatial processing of shape files.
 
 from __future__ import annotations
 
-import itertools
-import matplotlib.path as plth
-import matplotlib.pyplot as plt
 import numpy as np
+import shapely.errors
 import shapely.geometry
 import tempfile
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pyproj import Geod
 from shapefile import Shape, ShapeRecord, Reader, Shapes, Writer, POINT
-from shapely.geometry import Polygon, MultiPolygon, LinearRing, Point
-from shapely.prepared import prep
-from sklearn.cluster import KMeans
-from scipy.spatial import Voronoi
+from shapely.geometry import Polygon, MultiPolygon, MultiPoint, LinearRing, Point, box
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+from rastertools.utils import cpu_workers, jit_kernels, save_json
+
+# matplotlib and scikit-learn are imported where used, they are slow to import
+# and not needed for clipping
+if TYPE_CHECKING:
+    import matplotlib.path as plth
+    import matplotlib.pyplot as plt
 
 
 class ShapeView:
@@ -31,9 +34,12 @@ class ShapeView:
         self.name_attr: str = name_attr or self.default_shape_attr
         self.shape: Shape = shape
         self._points: np.ndarray = None
+        self._part_offsets: np.ndarray = None
+        self._xy_min: np.ndarray = None
+        self._xy_max: np.ndarray = None
         self.record: ShapeRecord = record
         self.center: tuple[float, float] = (0.0, 0.0)
-        self.paths: list[plth.Path] = []
+        self._paths: list[plth.Path] = None
         self.areas: list[float] = []
 
     def __str__(self):
@@ -49,27 +55,58 @@ class ShapeView:
     def points(self):
         """The list of point defining shape geometry."""
         if self._points is None:
-            self._points = np.array(self.shape.points)
+            # C-contiguous float64, so GEOS/numba consumers don't copy
+            self._points = np.ascontiguousarray(self.shape.points, dtype=np.float64)
         return self._points
 
+    @property
+    def part_offsets(self) -> np.ndarray:
+        """Offsets of shape parts in the points array, part `i` spanning `offsets[i]:offsets[i + 1]`."""
+        if self._part_offsets is None:
+            parts = np.asarray(self.shape.parts, dtype=np.int64)
+            self._part_offsets = np.append(parts, len(self.points))
+        return self._part_offsets
+
     @property
     def xy_max(self):
         """Max x, y coordinates, based on point coordinates."""
-        return np.max(self.points, axis=0)
+        if self._xy_max is None:
+            self._xy_max = np.max(self.points, axis=0)
+        return self._xy_max
 
     @property
     def xy_min(self):
         """Min x, y coordinates, based on point coordinates."""
-        return np.min(self.points, axis=0)
+        if self._xy_min is None:
+            self._xy_min = np.min(self.points, axis=0)
+        return self._xy_min
+
+    @property
+    def paths(self) -> list[plth.Path]:
+        """Matplotlib paths of shape parts, built on first access."""
+        if self._paths is None:
+            import matplotlib.path as plth
+
+            offsets = self.part_offsets
+            self._paths = [
+                plth.Path(self.points[lo:hi], closed=True, readonly=True)
+                for lo, hi in zip(offsets[:-1], offsets[1:])
+            ]
+        return self._paths
+
+    @property
+    def positive_parts(self) -> np.ndarray:
+        """Boolean array, True for positive (clockwise) parts and False for negative parts (holes)."""
+        return np.asarray(self.areas) > 0
 
     @property
     def parts_count(self):
         """Number of shape parts."""
-        return len(self.paths)
+        return len(self.part_offsets) - 1
 
     def validate(self) -> None:
-        assert self.points.shape[0] != 0 and len(self.paths) > 0, "No parts in a shape."
-        assert len(self.paths) == len(self.areas), (
+        assert self.points.shape[0] != 0 and self.parts_count > 0, "No parts in a shape."
+        assert self.parts_count == len(self.areas), (
             "Inconsistent number of parts in a shape."
         )
         assert self.name is not None and self.name != "", "Shape has no name."
@@ -88,15 +125,19 @@ class ShapeView:
     def _as_multi_polygon(shape: Shape):
         return MultiPolygon([shape]) if isinstance(shape, Polygon) else shape
 
+    @staticmethod
+    def open_reader(shape_stem: Union[str, Path, Reader]) -> Reader:
+        return shape_stem if isinstance(shape_stem, Reader) else Reader(str(shape_stem))
+
     @classmethod
     def read_shapes(
         cls, shape_stem: Union[str, Path, Reader]
     ) -> tuple[Reader, Shapes[Shape], list[ShapeRecord]]:
-        reader: Reader = (
-            shape_stem if isinstance(shape_stem, Reader) else Reader(str(shape_stem))
-        )
-        shapes: Shapes[Shape] = reader.shapes()
-        records: list[ShapeRecord] = reader.records()
+        reader: Reader = cls.open_reader(shape_stem)
+        # Single streamed pass over shapes and records
+        shape_recs = list(reader.iterShapeRecords())
+        shapes: Shapes[Shape] = Shapes(sr.shape for sr in shape_recs)
+        records: list[ShapeRecord] = [sr.record for sr in shape_recs]
         return reader, shapes, records
 
     @classmethod
@@ -114,44 +155,40 @@ class ShapeView:
             list: A list of `ShapeView` objects containing parsed shape information.
         """
         # Shapefiles
-        reader, sf1s, sf1r = cls.read_shapes(shape_stem)
+        reader = cls.open_reader(shape_stem)
 
         # Output dictionary
         shapes_data: list[cls] = []
 
-        # Iterate of shapes in shapefile
-        for k1 in range(len(sf1r)):
+        # Iterate of shapes in shapefile (streamed, one shape record at a time)
+        for shape_rec in reader.iterShapeRecords():
             # First (only) field in shapefile record is dot-name
-            shp = cls(shape=sf1s[k1], record=sf1r[k1], name_attr=shape_attr)
-
-            # List of parts in (potentially) multi-part shape
-            prt_list = list(shp.shape.parts) + [len(shp.points)]
-
-            # Accumulate total area centroid over multiple parts
-            Cx_tot = Cy_tot = Axy_tot = 0.0
-
-            # Iterate over parts of shapefile
-            for k2 in range(len(prt_list) - 1):
-                shp_prt = shp.points[prt_list[k2] : prt_list[k2 + 1]]
-                path_shp = plth.Path(shp_prt, closed=True, readonly=True)
+            shp = cls(shape=shape_rec.shape, record=shape_rec.record, name_attr=shape_attr)
+            shapes_data.append(shp)
 
-                # Estimate area for part
-                area_prt = area_sphere(shp_prt)
+        # Estimate areas and area centroids of all parts of all shapes at once
+        all_offsets = [np.zeros(1, dtype=np.int64)]
+        for shp in shapes_data:
+            all_offsets.append(shp.part_offsets[1:] + all_offsets[-1][-1])
+        all_points = [shp.points.reshape(-1, 2) for shp in shapes_data]
+        areas, Cx, Cy, Axy = parts_area_centroid(
+            np.concatenate(all_points + [np.empty((0, 2))]), np.concatenate(all_offsets)
+        )
 
-                shp.paths.append(path_shp)
-                shp.areas.append(area_prt)
+        k2 = 0
+        for shp in shapes_data:
+            prt = slice(k2, k2 + shp.parts_count)
+            k2 = prt.stop
+            shp.areas = list(areas[prt])
 
-                # Estimate area centroid for part, accumulate
-                (Cx, Cy, Axy) = centroid_area(shp_prt)
-                Cx_tot += Cx * Axy
-                Cy_tot += Cy * Axy
-                Axy_tot += Axy
+            # Accumulate total area centroid over multiple parts
+            Cx_tot = float(np.sum(Cx[prt] * Axy[prt]))
+            Cy_tot = float(np.sum(Cy[prt] * Axy[prt]))
+            Axy_tot = float(np.sum(Axy[prt]))
 
             # Update value for area centroid
             shp.center = (Cx_tot / Axy_tot, Cy_tot / Axy_tot)
 
-            shapes_data.append(shp)
-
         return shapes_data
 
 
@@ -173,8 +210,11 @@ def shapes_to_polygons_dict(
     """
     # Example loading shape files as multi polygons
     # https://gis.stackexchange.com/questions/70591/creating-shapely-multipolygons-from-shapefile-multipolygons
-    _, shapes, records = ShapeView.read_shapes(shape_stem)
-    polygons = {r.DOTNAME: shapely.geometry.shape(s) for s, r in zip(shapes, records)}
+    reader = ShapeView.open_reader(shape_stem)
+    polygons = {
+        sr.record.DOTNAME: shapely.geometry.shape(sr.shape)
+        for sr in reader.iterShapeRecords()
+    }
     if all_multi:
         polygons = {
             n: MultiPolygon([p]) if isinstance(p, Polygon) else p
@@ -214,17 +254,71 @@ def polygon_contains(
     Returns:
         np.ndarray: An array of points that are inside the polygon.
     """
-    mp = prep(polygon)  # prep
-    pts: list[Point] = (
-        [Point(t[0], t[1]) for t in points]
+    pts: np.ndarray = (
+        points
         if isinstance(points, np.ndarray)
-        else points
+        else np.array([[p.x, p.y] for p in points], dtype=np.float64).reshape(-1, 2)
+    )
+    pts = np.ascontiguousarray(pts[:, :2], dtype=np.float64)
+
+    # Early-reject points outside the bounding box, then run a vectorized test against
+    # the prepared geometry (single GEOS call over the remaining points)
+    min_x, min_y, max_x, max_y = polygon.bounds
+    in_box = (
+        (pts[:, 0] >= min_x)
+        & (pts[:, 0] <= max_x)
+        & (pts[:, 1] >= min_y)
+        & (pts[:, 1] <= max_y)
     )
-    pts_in = [p for p in pts if mp.contains(p)]
-    pts_in_array: np.ndarray = np.array([[p.x, p.y] for p in pts_in])
+    pts_box = pts[in_box]
+
+    shapely.prepare(polygon)
+    pts_in_bool = shapely.contains_xy(polygon, pts_box[:, 0], pts_box[:, 1])
+
+    pts_in_array: np.ndarray = pts_box[pts_in_bool]
     return pts_in_array
 
 
+def rings_contain_points(
+    ring_xy: np.ndarray, ring_offsets: np.ndarray, ring_positive: np.ndarray, points: np.ndarray
+) -> np.ndarray:
+    """
+    Determines which points are inside a set of positive rings and outside negative rings (holes).
+
+    Note:
+        Rings are applied in order, as a union with positive rings and a difference with negative rings,
+        so overlapping positive rings don't cancel out and a hole only removes points of preceding rings.
+
+    Args:
+        ring_xy (np.ndarray): A (N,2) array of ring coordinates.
+        ring_offsets (np.ndarray): Ring offsets, ring `i` spanning rows `offsets[i]:offsets[i + 1]`.
+        ring_positive (np.ndarray): Boolean array, True for positive rings and False for holes.
+        points (np.ndarray): A (M,2) array of points to check.
+
+    Returns:
+        np.ndarray: A boolean array, True for points interior to the rings.
+    """
+    kernels = jit_kernels()
+    if kernels is not None:
+        return kernels.rings_contain_jit(
+            np.ascontiguousarray(ring_xy, dtype=np.float64),
+            np.ascontiguousarray(ring_offsets, dtype=np.int64),
+            np.ascontiguousarray(ring_positive, dtype=np.bool_),
+            np.ascontiguousarray(points, dtype=np.float64),
+        )
+
+    import matplotlib.path as plth
+
+    inside = np.zeros(points.shape[0], dtype=bool)
+    for lo, hi, positive in zip(ring_offsets[:-1], ring_offsets[1:], ring_positive):
+        ring_inside = plth.Path(ring_xy[lo:hi], closed=True).contains_points(points)
+        if positive:
+            inside |= ring_inside
+        else:
+            inside &= ~ring_inside
+    return inside
+
+
 def polygon_area_km2(polygon: Union[Polygon, MultiPolygon]) -> np.float64:
     """
     Calculates the area of a polygon in square kilometers.
@@ -259,7 +353,7 @@ def polygon_to_coords(geom: Union[Polygon, LinearRing]) -> list[tuple[float, flo
     else:
         raise TypeError(f"Unsupported geometry type {type(geom)}")
 
-    shp_prt: np.ndarray = np.array([(val[0], val[1]) for val in xy_set])
+    shp_prt: np.ndarray = np.asarray(xy_set, dtype=np.float64)[:, :2]
     coords_list: list[tuple[float, float]] = shp_prt.tolist()
     return coords_list
 
@@ -275,9 +369,15 @@ def polygons_to_parts(polygons: list[Polygon]) -> list[list[tuple[float, float]]
         list[list[tuple[float, float]]]: A list of parts
     """
 
-    all_polygons = [[p] + list(p.interiors) for p in polygons]
-    all_polygons_list = list(itertools.chain(*all_polygons))
-    poly_as_list = [polygon_to_coords(p) for p in all_polygons_list]
+    # Exterior ring followed by interior rings, for each polygon
+    all_rings = shapely.get_rings(polygons)
+    if len(all_rings) == 0:
+        return []
+
+    # Extract coordinates of all rings in one call, then split them back per ring
+    coords = shapely.get_coordinates(all_rings)
+    offsets = np.cumsum(shapely.get_num_coordinates(all_rings))[:-1]
+    poly_as_list = [c.tolist() for c in np.split(coords, offsets)]
     return poly_as_list
 
 
@@ -295,20 +395,106 @@ def area_sphere(shape_points) -> float:
     Returns:
         float: The area of the polygon.
     """
+    kernels = jit_kernels()
+    if kernels is not None:
+        return kernels.area_sphere_jit(np.ascontiguousarray(shape_points, dtype=np.float64))
+
+    dalph = sphere_edge_angles(shape_points)
+    tarea = 6371.0 * 6371.0 * np.sum(dalph)
+
+    return tarea
+
+
+def sphere_edge_angles(shape_points: np.ndarray) -> np.ndarray:
+    """
+    Per-edge terms of `area_sphere`, evaluated in place in three scratch arrays.
+
+    Args:
+        shape_points (numpy.ndarray): A (N,2) numpy array of points, edge `k` joining points `k` and `k + 1`.
+
+    Returns:
+        numpy.ndarray: An array of N - 1 edge angles (radians), summing to the area on a unit sphere.
+    """
     sp_rad = np.radians(shape_points)
     beta1 = sp_rad[:-1, 1]
     beta2 = sp_rad[1:, 1]
-    domeg = sp_rad[1:, 0] - sp_rad[:-1, 0]
 
-    val1 = (
-        np.tan(domeg / 2)
-        * np.sin((beta2 + beta1) / 2.0)
-        * np.cos((beta2 - beta1) / 2.0)
-    )
-    dalph = 2.0 * np.arctan(val1)
-    tarea = 6371.0 * 6371.0 * np.sum(dalph)
+    # tan(domeg / 2) * sin((beta2 + beta1) / 2) * cos((beta2 - beta1) / 2)
+    val1 = np.subtract(sp_rad[1:, 0], sp_rad[:-1, 0])
+    val1 /= 2
+    np.tan(val1, out=val1)
+    tmp = np.add(beta2, beta1)
+    tmp /= 2.0
+    np.sin(tmp, out=tmp)
+    val1 *= tmp
+    np.subtract(beta2, beta1, out=tmp)
+    tmp /= 2.0
+    np.cos(tmp, out=tmp)
+    val1 *= tmp
+
+    # dalph = 2 * arctan(val1)
+    np.arctan(val1, out=val1)
+    val1 *= 2.0
+    return val1
+
+
+def parts_area_centroid(
+    points: np.ndarray, part_offsets: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculates spherical areas and area centroids of many shape parts at once.
 
-    return tarea
+    Note:
+        With numba, all parts are processed by a single compiled kernel. Otherwise, per-edge terms are
+        computed for all parts in vectorized calls and summed per part in a single `np.add.reduceat`.
+        Equivalent to calling `area_sphere` and `centroid_area` for each part, up to floating point
+        rounding (the summation order differs; ~1e-12 relative, larger only for near-zero part areas).
+
+    Args:
+        points (numpy.ndarray): A (N,2) numpy array of concatenated part points.
+        part_offsets (numpy.ndarray): Part offsets, part `i` spanning rows `offsets[i]:offsets[i + 1]`.
+
+    Returns:
+        tuple: Arrays of sphere areas, centroid coordinates and Cartesian areas of parts (areas, Cx, Cy, A).
+    """
+    kernels = jit_kernels()
+    if kernels is not None:
+        return kernels.parts_area_centroid_jit(
+            np.ascontiguousarray(points, dtype=np.float64),
+            np.ascontiguousarray(part_offsets, dtype=np.int64),
+        )
+
+    starts, ends = part_offsets[:-1], part_offsets[1:]
+    x = np.ascontiguousarray(points[:, 0], dtype=np.float64)
+    y = np.ascontiguousarray(points[:, 1], dtype=np.float64)
+
+    # Per-edge terms are computed for all parts at once (edge k joins points k and k + 1),
+    # then summed per part in a single reduction. Edges joining two parts are zeroed out,
+    # empty parts (no points) sum to zero.
+    non_empty = ends > starts
+    part_starts, joins = starts[non_empty], ends[non_empty] - 1
+
+    def edge_sums(edge_terms: np.ndarray) -> np.ndarray:
+        terms = np.zeros(len(edge_terms) + 1, dtype=np.float64)
+        terms[:-1] = edge_terms
+        terms[joins] = 0.0
+        sums = np.zeros(len(starts), dtype=np.float64)
+        if len(part_starts) > 0:
+            sums[non_empty] = np.add.reduceat(terms, part_starts)
+        return sums
+
+    # Spherical areas, see area_sphere
+    areas = 6371.0 * 6371.0 * edge_sums(sphere_edge_angles(points))
+
+    # Area centroids, see centroid_area
+    a_vec = x[:-1] * y[1:] - x[1:] * y[:-1]
+    sum_a = edge_sums(a_vec)
+    A = sum_a / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Cx = edge_sums((x[:-1] + x[1:]) * a_vec) / (3.0 * sum_a)
+        Cy = edge_sums((y[:-1] + y[1:]) * a_vec) / (3.0 * sum_a)
+
+    return areas, Cx, Cy, A
 
 
 def centroid_area(shape_points) -> tuple[float, float, float]:
@@ -326,15 +512,20 @@ def centroid_area(shape_points) -> tuple[float, float, float]:
     Returns:
         tuple: A tuple containing the centroid coordinates and area as floats (Cx, Cy, A).
     """
+    kernels = jit_kernels()
+    if kernels is not None:
+        return kernels.centroid_area_jit(np.ascontiguousarray(shape_points, dtype=np.float64))
 
-    a_vec = (
-        shape_points[:-1, 0] * shape_points[1:, 1]
-        - shape_points[1:, 0] * shape_points[:-1, 1]
-    )
+    # Contiguous x and y columns (unit-stride products and BLAS dot products)
+    x = np.ascontiguousarray(shape_points[:, 0], dtype=np.float64)
+    y = np.ascontiguousarray(shape_points[:, 1], dtype=np.float64)
+    a_vec = x[:-1] * y[1:] - x[1:] * y[:-1]
 
-    A = np.sum(a_vec) / 2.0
-    Cx = np.sum((shape_points[:-1, 0] + shape_points[1:, 0]) * a_vec) / 6.0 / A
-    Cy = np.sum((shape_points[:-1, 1] + shape_points[1:, 1]) * a_vec) / 6.0 / A
+    # Weighted sums as dot products, scaled once after the reduction
+    sum_a = np.sum(a_vec)
+    A = sum_a / 2.0
+    Cx = np.dot(x[:-1] + x[1:], a_vec) / (3.0 * sum_a)
+    Cy = np.dot(y[:-1] + y[1:], a_vec) / (3.0 * sum_a)
 
     return (Cx, Cy, A)
 
@@ -346,6 +537,139 @@ def long_mult(lat):  # latitude in degrees
 
 # API
 
+# Number of mesh points above which shape_subdivide switches to mini-batch k-means
+MINIBATCH_KMEANS_MIN_POINTS: int = 20000
+
+# Lower bound of the shape-to-bounding-box area ratio used to scale the subdivision mesh
+# (the fill scaling grows a mesh at most 1 / MIN_MESH_BBOX_FILL times)
+MIN_MESH_BBOX_FILL: float = 0.1
+
+# Number of mesh points the fill scaling doesn't grow a mesh past (2000 x 2000 points, ~64 MB of coordinates)
+MAX_MESH_POINTS: int = 4000000
+
+
+def mesh_dim(multi: Union[Polygon, MultiPolygon], target_points: int) -> int:
+    """
+    Subdivision mesh dimension, so that about `target_points` mesh points fall inside the shape.
+
+    Note:
+        The mesh is uniform in a frame where longitudes are shrunk by `1 / long_mult(lat)`
+        (the frame before the mesh is stretched), so the mesh density is scaled by the fraction
+        of the mesh covered by the shape in that frame. The scaling is bounded by `MIN_MESH_BBOX_FILL`
+        and never grows the mesh past `MAX_MESH_POINTS` points (or `target_points`, if larger).
+
+    Args:
+        multi (Union[Polygon, MultiPolygon]): The (valid) polygon or MultiPolygon to subdivide.
+        target_points (int): The number of mesh points targeted inside the shape.
+
+    Returns:
+        int: Number of mesh points along each axis.
+    """
+    x_min, y_min, x_max, y_max = multi.bounds
+    mesh_area = (x_max - x_min) * (y_max - y_min)
+
+    def shrink(xy: np.ndarray) -> np.ndarray:
+        return np.column_stack([x_min + (xy[:, 0] - x_min) / long_mult(xy[:, 1]), xy[:, 1]])
+
+    bbox_fill = shapely.area(shapely.transform(multi, shrink)) / mesh_area if mesh_area > 0 else 1.0
+    bbox_fill = float(np.clip(bbox_fill, MIN_MESH_BBOX_FILL, 1.0))
+
+    point_count = min(target_points / bbox_fill, max(target_points, MAX_MESH_POINTS))
+    return int(np.ceil(np.sqrt(point_count)))
+
+
+def subdivide_multi_polygon(
+    multi: Union[Polygon, MultiPolygon],
+    box_target_area_km2: int,
+    points_per_box: int,
+    random_seed: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Subdivides a single (Multi)Polygon into Voronoi regions of (roughly) equal area.
+
+    Args:
+        multi (Union[Polygon, MultiPolygon]): The polygon or MultiPolygon to subdivide.
+        box_target_area_km2 (float): Target box area used to calculate the number of boxes (clusters).
+        points_per_box (int): Points-per-box dimension.
+        random_seed (int): Random seed for reproducibility.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Cluster centers and the array of sub-shape geometries.
+    """
+    multi_area = polygon_area_km2(multi)
+    num_box = np.maximum(int(np.round(multi_area / box_target_area_km2)), 1)
+
+    # Fix broken multi-polygons in a single pass (valid shapes are returned as they are),
+    # the "structure" method keeps the result polygonal.
+    multi = shapely.make_valid(multi, method="structure", keep_collapsed=False)
+
+    # Start with a rectangular mesh, then (roughly) correct longitude (x values);
+    # Assume spacing on latitude (y values) is constant; x value spacing needs to
+    # be increased based on y value.
+    # The multiplier only depends on latitude, so it is computed once per mesh row.
+    xspan = [multi.bounds[0], multi.bounds[2]]
+    yspan = [multi.bounds[1], multi.bounds[3]]
+    pts_dim = mesh_dim(multi, num_box * points_per_box)
+    x_1d = np.linspace(xspan[0], xspan[1], pts_dim)
+    y_1d = np.linspace(yspan[0], yspan[1], pts_dim)
+    lm = long_mult(y_1d)[:, None]
+
+    pts_vec = np.empty((pts_dim * pts_dim, 2))
+    pts_vec[:, 0] = (x_1d[None, :] * lm - xspan[0] * (lm - 1)).ravel()
+    pts_vec[:, 1] = np.repeat(y_1d, pts_dim)
+
+    # Same idea here as in raster clipping; identify points that are inside the shape
+    # and keep track of them using inBool
+    pts_vec_in = polygon_contains(multi, pts_vec)
+
+    from sklearn.cluster import KMeans, MiniBatchKMeans
+    from threadpoolctl import threadpool_limits
+
+    # Feed points interior to shape into k-means clustering to get num_box equal(-ish) clusters;
+    # large meshes use mini-batch updates instead of full Lloyd iterations over all points.
+    # Single precision is plenty for clustering and halves the memory traffic of the fit.
+    # Shapes are subdivided in parallel threads, so each fit runs single-threaded instead of
+    # starting its own OpenMP thread pool (the OpenMP limit only applies to the calling thread).
+    pts_vec_in = np.ascontiguousarray(pts_vec_in, dtype=np.float32)
+    with threadpool_limits(limits=1, user_api="openmp"):
+        if len(pts_vec_in) > MINIBATCH_KMEANS_MIN_POINTS:
+            sub_clust = MiniBatchKMeans(
+                n_clusters=num_box,
+                random_state=random_seed,
+                batch_size=min(1024, num_box * 32),
+                n_init=3,
+            ).fit(pts_vec_in)
+        else:
+            sub_clust = KMeans(
+                n_clusters=num_box, random_state=random_seed, n_init="auto"
+            ).fit(pts_vec_in)
+    sub_node = np.ascontiguousarray(
+        sub_clust.cluster_centers_, dtype=np.float64
+    )  # this is not a bug, that is the actual name of the property
+
+    # Don't actually want the cluster centers, goal is the outlines. Going from centers
+    # to outlines uses Voronoi tessellation. Extending the diagram to the shape envelope
+    # returns closed cells (one per center, in center order) that cover the whole shape.
+    vor_cells = shapely.get_parts(
+        shapely.voronoi_polygons(
+            MultiPoint(sub_node), extend_to=box(*multi.bounds), ordered=True
+        )
+    )
+
+    # If there's not 1 Voronoi region outline for each k-means cluster center
+    # at this point, something has gone very wrong. Time to bail.
+    if len(vor_cells) != len(sub_node):
+        raise ValueError(
+            "Failed to create a Voronoi region outline for each k-means cluster center."
+        )
+
+    # The Voronoi region outlines may extend beyond the shape outline and/or
+    # overlap with negative spaces, so intersect each Voronoi region with the
+    # shapely MultiPolygon created previously (all regions in a single vectorized call)
+    poly_regs = shapely.intersection(vor_cells, multi)
+
+    return sub_node, poly_regs
+
 
 def shape_subdivide(
     shape_stem: Union[str, Path],
@@ -396,8 +720,11 @@ def shape_subdivide(
 
     # Read shapes
     sf1 = Reader(shape_stem)
-    multi_list = shapes_to_polygons(sf1)
-    rec_list = sf1.records()
+    # Shapes and records are read in a single pass, single-part shapes are kept
+    # as plain Polygons (no need for MultiPolygon wrapping)
+    shape_recs = list(sf1.iterShapeRecords())
+    multi_list = [shapely.geometry.shape(sr.shape) for sr in shape_recs]
+    rec_list = [sr.record for sr in shape_recs]
 
     # Create shape writer
     out_dir = Path(out_dir or Path(tempfile.mkdtemp()))
@@ -427,103 +754,47 @@ def shape_subdivide(
 
     top_n = top_n or len(multi_list)
 
+    # Shapes are subdivided independently in a thread pool; outputs are written in order
+    fts = {}
+    executor = ThreadPoolExecutor(max_workers=cpu_workers())
     for k1, multi in enumerate(multi_list[:top_n]):
-        multi_area = polygon_area_km2(multi)
-        num_box = np.maximum(int(np.round(multi_area / box_target_area_km2)), 1)
-        pts_dim = int(np.ceil(np.sqrt(points_per_box * num_box)))
-
-        if not multi.is_valid:
-            multi = multi.buffer(0)  # this seems to be fixing broken multi-polygons.
-            if verbose and multi.is_valid:
-                print(f"Fixed the invalid MultiPolygon {k1}.")
-
-        if multi.is_valid:
-            # Debug logging: shapefile index, target number of subdivisions
-            bounds_str = str([round(v, 2) for v in multi.bounds])
-            if verbose:
-                print(
-                    f"MultiPolygon: {k1:<5} {bounds_str:<32} Number of boxes: {num_box}"
-                )
-        else:
-            Warning(f"Unable to fix the MultiPolygon {k1}!")
-
-        # Start with a rectangular mesh, then (roughly) correct longitude (x values);
-        # Assume spacing on latitude (y values) is constant; x value spacing needs to
-        # be increased based on y value.
-        xspan = [multi.bounds[0], multi.bounds[2]]
-        yspan = [multi.bounds[1], multi.bounds[3]]
-        xcv, ycv = np.meshgrid(
-            np.linspace(xspan[0], xspan[1], pts_dim),
-            np.linspace(yspan[0], yspan[1], pts_dim),
+        fts[k1] = executor.submit(
+            subdivide_multi_polygon,
+            multi=multi,
+            box_target_area_km2=box_target_area_km2,
+            points_per_box=points_per_box,
+            random_seed=random_seed,
         )
 
-        pts_vec = np.zeros((pts_dim * pts_dim, 2))
-        pts_vec[:, 0] = np.reshape(xcv, pts_dim * pts_dim)
-        pts_vec[:, 1] = np.reshape(ycv, pts_dim * pts_dim)
-        pts_vec[:, 0] = pts_vec[:, 0] * long_mult(pts_vec[:, 1]) - xspan[0] * (
-            long_mult(pts_vec[:, 1]) - 1
-        )
+    # Shapes that fail to subdivide are skipped (and reported) so the rest of the batch completes
+    skipped: list[str] = []
+    for k1, ft in fts.items():
+        try:
+            sub_node, poly_regs = ft.result()
+        except (ValueError, shapely.errors.GEOSException) as ex:
+            print(f"Skipping MultiPolygon {k1}: {ex}")
+            skipped.append(rec_list[k1][shape_attr])
+            continue
+
+        # Debug logging: shapefile index, number of subdivisions (printed here, not from worker threads)
+        if verbose:
+            bounds_str = str([round(v, 2) for v in multi_list[k1].bounds])
+            print(f"MultiPolygon: {k1:<5} {bounds_str:<32} Number of boxes: {len(sub_node)}")
+
+        # Record template shared by all sub-shapes of this shape
+        rec_template = rec_list[k1].as_dict()
+        dotname = rec_template[shape_attr]
 
-        # Same idea here as in raster clipping; identify points that are inside the shape
-        # and keep track of them using inBool
-        pts_vec_in = polygon_contains(multi, pts_vec)
-
-        # Feed points interior to shape into k-means clustering to get num_box equal(-ish) clusters;
-        sub_clust = KMeans(
-            n_clusters=num_box, random_state=random_seed, n_init="auto"
-        ).fit(pts_vec_in)
-        sub_node = (
-            sub_clust.cluster_centers_
-        )  # this is not a bug, that is the actual name of the property
-
-        # Don't actually want the cluster centers, goal is the outlines. Going from centers
-        # to outlines uses Voronoi tessellation. Add a box of external points to avoid mucking
-        # up the edges. (+/- 200 was arbitrary value greater than any possible lat/long)
-        assert max(abs(sub_node.reshape(-1))) < 200, "Coordinates must be < 200."
-        EXT_PTS = np.array([[-200, -200], [200, -200], [-200, 200], [200, 200]])
-        vor_node = np.append(sub_node, EXT_PTS, axis=0)
-        vor_obj = Voronoi(vor_node)
-
-        # Extract the Voronoi region boundaries from the Voronoi object. Need to duplicate
-        # first point in each region so last == first for the next step
-        vor_list = list()
-        vor_vert = vor_obj.vertices
-        for vor_reg in vor_obj.regions:
-            if -1 in vor_reg or len(vor_reg) == 0:
-                continue
-            vor_loop = np.append(
-                vor_vert[vor_reg, :], vor_vert[vor_reg[0:1], :], axis=0
-            )
-            vor_list.append(vor_loop)
-
-        # If there's not 1 Voronoi region outline for each k-means cluster center
-        # at this point, something has gone very wrong. Time to bail.
-        if len(vor_list) != len(sub_node):
-            raise ValueError(
-                "Failed to create a Voronoi region outline for each k-means cluster center."
-            )
-
-        # The Voronoi region outlines may extend beyond the shape outline and/or
-        # overlap with negative spaces, so intersect each Voronoi region with the
-        # shapely MultiPolygon created previously
         new_recs = None
-        for k2, poly in enumerate(vor_list):
-            # Voronoi region are convex, so will not need MultiPolygon object
-            poly_reg = (Polygon(poly)).intersection(multi)
-
+        for k2, poly_reg in enumerate(poly_regs):
             # Each Voronoi region will be a new shape; give it a name
-            new_recs = rec_list[k1].as_dict()
-            dotname = rec_list[k1][shape_attr]
-            dotname_new = f"{dotname}:A{k2:04d}"
-            new_recs[shape_attr] = dotname_new
+            new_recs = rec_template.copy()
+            new_recs[shape_attr] = f"{dotname}:A{k2:04d}"
 
             assert poly_reg.geom_type in ["Polygon", "MultiPolygon"], (
                 "Unsupported geometry type"
             )
-            poly_list = (
-                poly_reg.geoms if poly_reg.geom_type == "MultiPolygon" else [poly_reg]
-            )
-            poly_as_list = polygons_to_parts(poly_list)
+            poly_as_list = polygons_to_parts(shapely.get_parts(poly_reg))
 
             # Add the new shape to the shapefile; splat the record
             sf1new.poly(poly_as_list)
@@ -535,6 +806,11 @@ def shape_subdivide(
                 assert output_centers
                 sf1new2.record(*new_recs)
 
+    executor.shutdown(wait=True)
+
+    if len(skipped) > 0:
+        save_json({"skipped": skipped}, f"{out_shape_stem}_skipped.json")
+
     sf1new.close()
     if output_centers:
         sf1new2.close()
@@ -565,6 +841,8 @@ def plot_shapes(
     Returns:
         tuple[plt.Figure, plt.Axes]: The figure and axis objects.
     """
+    import matplotlib.pyplot as plt
+
     # Plot sub-shapes
     if ax is None:
         fig, ax = plt.subplots()
@@ -5,11 +5,24 @@ Helper functions used by other package modules.
 
 import hashlib
 import json
+import os
+import re
 import zipfile
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Union
 
+try:
+    import orjson  # optional, faster JSON parsing
+except ImportError:
+    orjson = None
+
+# Integer literals with 19+ digits may not fit in 64 bits, orjson would parse them as floats
+_LONG_INT_LITERAL = re.compile(rb"(?<![\d.])\d{19,}")
+
 
 def read_json(json_path: Union[str, Path]) -> dict[str, Any]:
     """
@@ -22,9 +35,14 @@ def read_json(json_path: Union[str, Path]) -> dict[str, Any]:
         dict: A dictionary representing the JSON structure.
     """
     assert Path(json_path).exists(), f"JSON file {json_path} not found."
-    with open(json_path) as fp:
-        data: dict = json.load(fp)
-
+    content = Path(json_path).read_bytes()
+    if orjson is not None and not _LONG_INT_LITERAL.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN values written by save_json, only accepted by the json module
+
+    data: dict = json.loads(content)
     return data
 
 
@@ -58,16 +76,53 @@ def extract_archive(file_path: Union[str, Path]) -> list[str]:
     Returns:
         list: A list of extracted file paths.
     """
+    file_path = Path(file_path)
     dst_dir = file_path.parent.joinpath(file_path.stem)
     Path(dst_dir).mkdir(exist_ok=True, parents=True)
     with zipfile.ZipFile(file_path, "r") as zip_ref:
         print(f"Extracting file {file_path}")
-        zip_ref.extractall(dst_dir)
+        members = zip_ref.infolist()
+        files = [m for m in members if not m.is_dir()]
+
+        # Directories (including parents of the sanitized member paths) are created upfront and serially,
+        # so members can be decompressed in parallel (zlib releases the GIL, reads of the shared
+        # archive file are synchronized)
+        for m in members:
+            if m.is_dir():
+                zip_ref.extract(m, dst_dir)
+            else:
+                archive_member_path(dst_dir, m).parent.mkdir(exist_ok=True, parents=True)
+
+        with ThreadPoolExecutor(max_workers=min(cpu_workers(), max(len(files), 1))) as executor:
+            # List extracted files from the extraction results instead of re-walking the file system
+            extracted_files = list(executor.map(lambda m: zip_ref.extract(m, dst_dir), files))
 
-    extracted_files = [str(f) for f in Path(dst_dir).rglob("*.*")]
     return extracted_files
 
 
+def archive_member_path(dst_dir: Union[str, Path], member: zipfile.ZipInfo) -> Path:
+    """
+    Path a ZIP archive member is extracted to, sanitized the same way as in `ZipFile.extract`.
+
+    Args:
+        dst_dir (str): Extraction directory.
+        member (ZipInfo): Archive member.
+
+    Returns:
+        Path: The member's extraction path, always within `dst_dir`.
+    """
+    # Absolute paths are made relative, drive letters, empty, "." and ".." components are dropped
+    arcname = member.filename.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    arcname = os.path.sep.join(x for x in arcname.split(os.path.sep) if x not in ("", os.path.curdir, os.path.pardir))
+    if os.path.sep == "\\":
+        # Characters illegal on Windows are replaced, as zipfile does
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+    return Path(os.path.normpath(os.path.join(dst_dir, arcname)))
+
+
 def sha256(file_path) -> str:
     """
     Calculates the SHA-256 hash of a file.
@@ -85,8 +140,35 @@ def sha256(file_path) -> str:
         return ""
 
     sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        # Read and update hash string value in blocks of 4K
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+    # Read and update hash string value in blocks of 4M, reusing a single buffer
+    buffer = bytearray(1 << 22)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while (size := f.readinto(buffer)) > 0:
+            sha256_hash.update(view[:size])
     return sha256_hash.hexdigest()
+
+
+def cpu_workers() -> int:
+    """
+    Number of worker threads used for parallel per-shape processing.
+
+    Returns:
+        int: The CPU count minus one (leaving a core for the main thread), at least one.
+    """
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+@cache
+def jit_kernels() -> Union[ModuleType, None]:
+    """
+    Numba JIT-compiled kernels, imported on first use (numba is slow to import).
+
+    Returns:
+        module: The `rastertools.kernels` module, or None if numba is not installed.
+    """
+    try:
+        from rastertools import kernels
+    except ImportError:
+        return None
+    return kernels
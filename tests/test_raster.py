@@ -2,9 +2,13 @@ import numpy as np
 import pytest
 
 from pathlib import Path
+from PIL import Image, TiffImagePlugin, TiffTags
+from shapefile import Shape, POLYGON
 from typing import Dict
 
-from rastertools import raster_clip, raster_clip_weighted, utils
+from rastertools import raster, raster_clip, raster_clip_weighted, shape, utils
+from rastertools.raster import SparceData, init_sparce_matrix
+from rastertools.shape import ShapeView
 from pytest_init import change_test_dir  # don't remove
 
 
@@ -38,10 +42,154 @@ def test_raster_clip_stat_fn():
 def test_raster_clip_weighted():
     actual_weighted: Dict = raster_clip_weighted(pytest.raster_file, pytest.vacc_raster_file, pytest.shape_file)
     expected_weighted: Dict = utils.read_json(Path("expected").joinpath("clipped_pop_weighted_sum.json"))
-    assert all([not np.isnan(v["pop"]) for v in actual_weighted.values()]), "One or more pop values are NaN."
-    assert all([not np.isnan(v["val"]) for v in actual_weighted.values()]), "One or more weighted vacc value is NaN."
+    pops = np.array([v["pop"] for v in actual_weighted.values()], dtype=np.float64)
+    vals = np.array([v["val"] for v in actual_weighted.values()], dtype=np.float64)
+    assert not np.isnan(pops).any(), "One or more pop values are NaN."
+    assert not np.isnan(vals).any(), "One or more weighted vacc value is NaN."
     assert expected_weighted == actual_weighted
 
 
-# TODO: add unittests for helper functions form the raster module
+@pytest.mark.unit
+def test_raster_clip_shape_views():
+    """Testing clipping with already loaded shape views gives the same results as with the shape file."""
+    shapes = ShapeView.from_file(pytest.shape_file)
+
+    actual_pop: Dict = raster_clip(pytest.raster_file, shapes, quiet=True)
+    expected_pop: Dict = utils.read_json(Path("expected").joinpath("clipped_pop_sum.json"))
+    assert expected_pop == actual_pop
+    assert raster_clip(pytest.raster_file, pytest.shape_file, include_latlon=True, quiet=True) == raster_clip(
+        pytest.raster_file, shapes, include_latlon=True, quiet=True
+    )
+
+    # The same shape views are reused across calls
+    actual_weighted: Dict = raster_clip_weighted(pytest.raster_file, pytest.vacc_raster_file, shapes, quiet=True)
+    expected_weighted: Dict = utils.read_json(Path("expected").joinpath("clipped_pop_weighted_sum.json"))
+    assert expected_weighted == actual_weighted
+
+
+@pytest.mark.unit
+def test_sparce_data_lat_band():
+    """Testing the latitude band lookup, including bands empty at the edges of the data."""
+    lat = np.array([5.0, 4.0, 4.0, 3.0, 2.0, 1.0])
+    data = SparceData(np.arange(6.0), lat, np.arange(1, 7))
+    assert data.lat_descending
+
+    assert data.lat_band(3.5, 4.5) == slice(1, 3)
+    assert data.lat_band(3.0, 5.0) == slice(1, 3)  # bounds are exclusive
+    assert data.lat_band(0.0, 10.0) == slice(0, 6)
+    for lat_min, lat_max in [(6.0, 10.0), (-5.0, 1.0), (4.1, 4.9), (4.5, 3.5)]:
+        band = data.lat_band(lat_min, lat_max)
+        assert band.stop == band.start and len(data.val[band]) == 0
+    assert data.lat_band(6.0, 10.0).start == 0
+    assert data.lat_band(-5.0, 1.0).start == 6
+
+    with pytest.raises(AssertionError):
+        SparceData(np.arange(3.0), np.array([1.0, 2.0, 3.0]), np.ones(3)).lat_band(0.0, 4.0)
+
+
+@pytest.mark.unit
+def test_sparce_data_subset():
+    """Testing subsets selected by a slice, a boolean mask and an integer index."""
+    data = SparceData(np.arange(6.0), np.array([5.0, 4.0, 4.0, 3.0, 2.0, 1.0]), np.arange(1, 7))
+    assert np.array_equal(data.lonlat, np.column_stack([data.lon, data.lat]))
+
+    for index in [slice(1, 4), np.array([False, True, True, True, False, False]), np.array([1, 2, 3])]:
+        sub = data.subset(index)
+        assert len(sub) == 3
+        assert np.array_equal(sub.lon, [1.0, 2.0, 3.0])
+        assert np.array_equal(sub.lat, [4.0, 4.0, 3.0])
+        assert np.array_equal(sub.val, [2, 3, 4])
+        assert np.array_equal(sub.lonlat, data.lonlat[1:4])
+        assert sub.lat_descending
+        assert sub.lat_band(3.5, 4.5) == slice(0, 2)
+
+    assert len(data.subset(slice(0, 0))) == 0
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def kernels(request, monkeypatch) -> str:
+    """Runs a test with numba kernels and with their numpy/matplotlib fallbacks."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(raster, "jit_kernels", lambda: None)
+        monkeypatch.setattr(shape, "jit_kernels", lambda: None)
+    return request.param
+
+
+def square(x0: float, y0: float, x1: float, y1: float) -> list[tuple[float, float]]:
+    """Clockwise (positive) square ring."""
+    return [(x0, y0), (x0, y1), (x1, y1), (x1, y0), (x0, y0)]
+
+
+@pytest.mark.unit
+def test_is_interior_overlapping_parts(kernels):
+    """Testing interior points are the union of positive parts minus holes, also for overlapping parts."""
+    # Two overlapping positive parts and a (counter-clockwise) hole in the first one
+    points = square(0, 0, 2, 2) + square(1, 1, 3, 3) + square(0.2, 0.2, 0.8, 0.8)[::-1]
+    shp = ShapeView(Shape(shapeType=POLYGON, points=points, parts=[0, 5, 10]), {"DOTNAME": "TEST"})
+    shp.areas = [shape.area_sphere(shp.points[lo:hi]) for lo, hi in zip(shp.part_offsets[:-1], shp.part_offsets[1:])]
+    assert list(shp.positive_parts) == [True, True, False]
+
+    # Sorted by descending latitude, as raster pixels are
+    xy = np.array([[2.5, 2.5], [1.5, 1.5], [0.5, 1.5], [2.5, 0.5], [3.5, 0.5], [0.5, 0.5]])
+    expected = np.array([True, True, True, False, False, False])
+    data = SparceData(xy[:, 0], xy[:, 1], np.ones(len(xy)))
+
+    assert np.array_equal(raster.is_interior(shp, data), expected)
+    index, box_count = raster.clip_interior_index(shp, data)
+    assert np.array_equal(index, np.flatnonzero(expected))
+    assert box_count == 5
+
+
+def write_tiff(data: np.ndarray, tiff_path: Path, x0: float = 10.0, y0: float = 5.0, d: float = 0.5) -> Path:
+    """Writes a single band GeoTIFF with the tie point (x0, y0) and square pixels of size d."""
+    tags = TiffImagePlugin.ImageFileDirectory_v2()
+    tags[33922] = (0.0, 0.0, 0.0, x0, y0, 0.0)  # ModelTiepointTag
+    tags[33550] = (d, d, 0.0)  # ModelPixelScaleTag
+    tags.tagtype[33922] = tags.tagtype[33550] = TiffTags.DOUBLE
+    Image.fromarray(data).save(tiff_path, tiffinfo=tags)
+    return tiff_path
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "bounds, rows, cols",
+    [
+        ((11.3, 3.3, 12.2, 4.2), slice(1, 4), slice(2, 5)),  # interior, widened by a pixel on each side
+        ((9.0, 4.4, 10.6, 6.0), slice(0, 2), slice(0, 2)),  # top left raster edge
+        ((13.4, 0.0, 20.0, 2.6), slice(4, 6), slice(6, 8)),  # bottom right raster edge
+        ((9.0, 0.0, 20.0, 6.0), slice(0, 6), slice(0, 8)),  # whole raster
+        ((30.0, 30.0, 31.0, 31.0), slice(0, 0), slice(0, 0)),  # outside the raster
+    ],
+)
+def test_init_sparce_matrix_bounds(kernels, tmp_path, bounds, rows, cols):
+    """Testing sparce data is cropped to the pixels covering the bounds, including at raster edges."""
+    data = np.arange(48, dtype=np.int32).reshape(6, 8) - 9  # values > 0 from the second row on
+    with Image.open(write_tiff(data, tmp_path.joinpath("raster.tif"))) as raster:
+        actual = init_sparce_matrix(raster, bounds=bounds)
+
+    # Pixel centers of the expected raster window, values > 0 only
+    lon, lat = np.meshgrid(10.25 + 0.5 * np.arange(8), 4.75 - 0.5 * np.arange(6))
+    window = data[rows, cols] > 0
+    assert np.array_equal(actual.val, data[rows, cols][window])
+    assert np.array_equal(actual.lon, lon[rows, cols][window])
+    assert np.array_equal(actual.lat, lat[rows, cols][window])
+    assert actual.lat_descending
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dtype, expected_dtype",
+    [(np.uint8, np.uint8), (np.int32, np.int32), (np.float32, np.float64)],
+)
+def test_init_sparce_matrix_dtype(kernels, tmp_path, dtype, expected_dtype):
+    """Testing integer rasters keep their dtype and float rasters are promoted to double precision."""
+    data = np.array([[0, 1, 2], [3, 0, 4]], dtype=dtype)
+    with Image.open(write_tiff(data, tmp_path.joinpath("raster.tif"))) as raster:
+        actual = init_sparce_matrix(raster)
 
+    assert actual.val.dtype == expected_dtype
+    assert np.array_equal(actual.val, [1, 2, 3, 4])
+    assert np.array_equal(actual.lon, [10.75, 11.25, 10.25, 11.25])
+    assert np.array_equal(actual.lat, [4.75, 4.75, 4.25, 4.25])
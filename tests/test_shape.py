@@ -4,8 +4,12 @@ import re
 
 from typing import Dict
 
-from rastertools.shape import ShapeView, area_sphere, centroid_area, shape_subdivide
+from rastertools import shape, utils
+from rastertools.shape import ShapeView, area_sphere, centroid_area, parts_area_centroid, mesh_dim, shape_subdivide
+from rastertools.shape import MAX_MESH_POINTS, MIN_MESH_BBOX_FILL
+from shapely.geometry import Polygon
 from pytest_init import change_test_dir  # don't remove
+from shapefile import Writer
 
 from pathlib import Path
 
@@ -19,10 +23,16 @@ def shape_file() -> Path:
     return Path("data/cod_lev02_zones_test/cod_lev02_zones_test")
 
 
-@pytest.fixture()
-def one_shape(shape_file) -> ShapeView:
+@pytest.fixture(scope="module")
+def shapes() -> list[ShapeView]:
+    """Shape view objects loaded once per module (absolute path, module fixtures run before chdir)."""
+    return ShapeView.from_file(Path(__file__).parent.joinpath("data/cod_lev02_zones_test/cod_lev02_zones_test"))
+
+
+@pytest.fixture(scope="module")
+def one_shape(shapes) -> ShapeView:
     """Helper test property providing a sample shape view object."""
-    shapes_dict = {s.name: s for s in ShapeView.from_file(shape_file)}
+    shapes_dict = {s.name: s for s in shapes}
     return shapes_dict[pytest.expected_name]
 
 
@@ -44,16 +54,16 @@ def test_shape_properties(one_shape):
     # name, parts_count, areas
     assert pytest.expected_name == shp.name
     assert shp.parts_count == 2
-    assert round(len(shp.areas), 0) == 2
-    assert round(shp.areas[0], 4) == 729.4677
+    assert len(shp.areas) == 2
+    assert shp.areas[0] == pytest.approx(729.4677, abs=5e-5)
 
     # xy min/max
     assert isinstance(shp.xy_max, np.ndarray)
     assert isinstance(shp.xy_min, np.ndarray)
-    assert round(shp.xy_max[0], 4) == 28.0105
-    assert round(shp.xy_max[1], 4) == -11.5730
-    assert round(shp.xy_min[0], 4) == 27.6754
-    assert round(shp.xy_min[1], 4) == -11.959
+    assert shp.xy_max[0] == pytest.approx(28.0105, abs=5e-5)
+    assert shp.xy_max[1] == pytest.approx(-11.5730, abs=5e-5)
+    assert shp.xy_min[0] == pytest.approx(27.6754, abs=5e-5)
+    assert shp.xy_min[1] == pytest.approx(-11.959, abs=5e-5)
 
     # points
     assert isinstance(shp.points, np.ndarray)
@@ -62,8 +72,8 @@ def test_shape_properties(one_shape):
     assert np.array_equal(shp.points[0, :], shp.points[-1, :])
 
     # centroid
-    assert round(shp.center[0],4) == 27.8632
-    assert round(shp.center[1], 4) == -11.7542
+    assert shp.center[0] == pytest.approx(27.8632, abs=5e-5)
+    assert shp.center[1] == pytest.approx(-11.7542, abs=5e-5)
 
 
 @pytest.mark.unit
@@ -72,7 +82,7 @@ def test_shape_area_sphere(one_shape):
     parts = one_shape.shape.parts
     points: np.ndarray = one_shape.points[parts[0]:parts[1]]
     actual_area = area_sphere(points)
-    assert round(actual_area, 4), 729.4677
+    assert actual_area == pytest.approx(729.4677, abs=5e-5)
 
 
 @pytest.mark.unit
@@ -83,9 +93,38 @@ def test_shape_centroid_area(one_shape):
     points = shp.points[prt_list[0]:prt_list[1]]
     x1, y1, a1 = centroid_area(points)
 
-    assert round(x1, 4) == 27.8632
-    assert round(y1, 4) == -11.7542
-    assert round(abs(a1), 4) == 0.0603
+    assert x1 == pytest.approx(27.8632, abs=5e-5)
+    assert y1 == pytest.approx(-11.7542, abs=5e-5)
+    assert abs(a1) == pytest.approx(0.0603, abs=5e-5)
+
+
+@pytest.mark.unit
+def test_shape_parts_area_centroid(one_shape):
+    """Testing the vectorized part areas and centroids match the per-part functions."""
+    shp = one_shape
+    areas, cx, cy, a = parts_area_centroid(shp.points, shp.part_offsets)
+    assert len(areas) == len(shp.paths)
+
+    for k in range(len(areas)):
+        points = shp.points[shp.part_offsets[k]:shp.part_offsets[k + 1]]
+        assert areas[k] == pytest.approx(area_sphere(points))
+        assert (cx[k], cy[k], a[k]) == pytest.approx(centroid_area(points))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_shape_centers(shape_file, monkeypatch, use_numba):
+    """Testing shape centers match the area-weighted per-part centroids (up to rounding), with and without numba."""
+    if use_numba:
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(shape, "jit_kernels", lambda: None)
+
+    for shp in ShapeView.from_file(shape_file):
+        parts = [shp.points[lo:hi] for lo, hi in zip(shp.part_offsets[:-1], shp.part_offsets[1:])]
+        cx, cy, a = np.array([centroid_area(p) for p in parts]).T
+        assert shp.areas == pytest.approx([area_sphere(p) for p in parts], rel=1e-12)
+        assert shp.center == pytest.approx((np.sum(cx * a) / np.sum(a), np.sum(cy * a) / np.sum(a)), rel=1e-12)
 
 
 # Subdivision Tests
@@ -93,12 +132,13 @@ def test_shape_centroid_area(one_shape):
 
 @pytest.mark.unit
 def test_shape_sub_default(one_shape, shape_file):
+    # Default output directory (a new temporary directory)
     run_shape_sub_test(one_shape, shape_file)
 
 
 @pytest.mark.unit
-def test_shape_sub_shp(one_shape, shape_file):
-    run_shape_sub_test(one_shape, shape_file.with_suffix(".shp"))
+def test_shape_sub_shp(one_shape, shape_file, tmp_path):
+    run_shape_sub_test(one_shape, shape_file.with_suffix(".shp"), tmp_path)
 
 
 @pytest.mark.unit
@@ -107,18 +147,59 @@ def test_shape_sub_temp_dir(one_shape, shape_file, tmp_path):
 
 
 @pytest.mark.unit
-def test_shape_sub_400km(one_shape, shape_file):
-    run_shape_sub_test(one_shape, shape_file, target_area=400)
+def test_shape_sub_400km(one_shape, shape_file, tmp_path):
+    run_shape_sub_test(one_shape, shape_file, tmp_path, target_area=400)
+
+
+@pytest.mark.unit
+def test_shape_sub_120pt(one_shape, shape_file, tmp_path):
+    run_shape_sub_test(one_shape, shape_file, tmp_path, points_per_box=120)
 
 
 @pytest.mark.unit
-def test_shape_sub_120pt(one_shape, shape_file):
-    run_shape_sub_test(one_shape, shape_file, points_per_box=120)
+def test_shape_sub_seed(one_shape, shape_file, tmp_path):
+    run_shape_sub_test(one_shape, shape_file, tmp_path, random_seed=10)
+
+
+@pytest.mark.unit
+def test_shape_sub_skipped(tmp_path):
+    """Testing shapes failing to subdivide (no mesh points inside a sliver) are skipped and reported."""
+    shape_stem = tmp_path.joinpath("sliver")
+    with Writer(shape_stem) as writer:
+        writer.field("DOTNAME", "C", 70, 0)
+        writer.poly([[(0, 0), (0, 0.5), (0.5, 0.5), (0.5, 0), (0, 0)]])
+        writer.record("AFRO:SQUARE")
+        writer.poly([[(1, 1), (6, 4.0001), (6, 4), (1, 1)]])
+        writer.record("AFRO:SLIVER")
+
+    out_shape_stem = shape_subdivide(shape_stem=shape_stem, out_dir=tmp_path.joinpath("out"))
+
+    # The square is subdivided, the sliver is listed in the sidecar file
+    names = [s.name for s in ShapeView.from_file(out_shape_stem)]
+    assert len(names) > 1
+    assert all(n.startswith("AFRO:SQUARE:A") for n in names)
+    assert utils.read_json(f"{out_shape_stem}_skipped.json") == {"skipped": ["AFRO:SLIVER"]}
 
 
 @pytest.mark.unit
-def test_shape_sub_seed(one_shape, shape_file):
-    run_shape_sub_test(one_shape, shape_file, random_seed=10)
+def test_shape_mesh_dim():
+    """Testing the subdivision mesh is scaled by the shape's fill of the (stretched) mesh and capped."""
+    # A square at the equator fills its mesh, a triangle fills about half of it
+    square = Polygon([(0, 0), (0, 0.5), (0.5, 0.5), (0.5, 0)])
+    triangle = Polygon([(0, 0), (0, 0.5), (0.5, 0)])
+    assert mesh_dim(square, 2500) == pytest.approx(50, abs=1)
+    assert mesh_dim(triangle, 2500) == pytest.approx(np.sqrt(5000), abs=1)
+
+    # Large meshes (mini-batch k-means sizes) are scaled too
+    assert mesh_dim(triangle, 40000) == pytest.approx(np.sqrt(80000), abs=1)
+    assert mesh_dim(triangle, 40000) > int(np.ceil(np.sqrt(40000)))
+
+    # Slivers are bounded by the minimal fill, meshes aren't grown past the maximal mesh size
+    sliver = Polygon([(0, 0), (5, 3.0001), (5, 3)])
+    assert mesh_dim(sliver, 250) == int(np.ceil(np.sqrt(250 / MIN_MESH_BBOX_FILL)))
+    assert mesh_dim(sliver, 40000) == int(np.ceil(np.sqrt(40000 / MIN_MESH_BBOX_FILL)))
+    assert mesh_dim(sliver, MAX_MESH_POINTS // 2) == int(np.ceil(np.sqrt(MAX_MESH_POINTS)))
+    assert mesh_dim(sliver, 2 * MAX_MESH_POINTS) == int(np.ceil(np.sqrt(2 * MAX_MESH_POINTS)))
 
 
 def run_shape_sub_test(one_shape, shape_file, tmp_path=None, target_area=None, points_per_box=None, random_seed=None):
@@ -129,6 +210,7 @@ def run_shape_sub_test(one_shape, shape_file, tmp_path=None, target_area=None, p
                                      random_seed=random_seed)
     # Verify
     assert str(out_shape_stem).endswith(f"_{target_area or 100}km"), "Default name must end with target area."
+    assert not Path(f"{out_shape_stem}_skipped.json").exists(), "No shapes should be skipped."
     sub_shapes = [s for s in ShapeView.from_file(out_shape_stem) if s.name.startswith(pytest.expected_name)]
     names = [s.name[len(pytest.expected_name)+1:] for s in sub_shapes]
     names_ok = [re.match("^[A-Z]0{3}[0-9]$", n) is not None for n in names]
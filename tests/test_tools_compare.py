@@ -1,9 +1,12 @@
 import numpy as np
 import pytest
+import shapely
 import sys
 
+from pathlib import Path
 from shapely.geometry import Polygon
 from pyproj import Geod
+from shapefile import Reader
 
 from rastertools.shape import ShapeView, area_sphere, centroid_area
 from pytest_init import change_test_dir  # don't remove
@@ -14,6 +17,21 @@ def setup_function() -> None:
     pytest.expected_name = "AFRO:DRCONGO:HAUT_KATANGA:KAMPEMBA"
 
 
+test_shape_stem = Path(__file__).parent.joinpath("data/cod_lev02_zones_test/cod_lev02_zones_test")
+
+
+@pytest.fixture(scope="module")
+def shapes() -> list[ShapeView]:
+    """Shape view objects loaded once per module (absolute path, module fixtures run before chdir)."""
+    return ShapeView.from_file(test_shape_stem)
+
+
+def shape_indices() -> list[int]:
+    """Indices of shapes in the test shape file (header only, shapes are loaded by the fixture)."""
+    with Reader(str(test_shape_stem)) as reader:
+        return list(range(len(reader)))
+
+
 # Sphere area function vs. pyproj
 sphere_area_diff_perc = 0.005
 
@@ -38,9 +56,8 @@ def test_area_sphere_vs_pyproj_simple():
 
 @pytest.mark.unit
 @pytest.mark.skipif('pyproj' not in sys.modules, reason="requires the 'pyproj' library")
-def test_area_sphere_vs_pyproj_many():
+def test_area_sphere_vs_pyproj_many(shapes):
     """Compare sphere area diff for shapes in the test shape file."""
-    shapes = ShapeView.from_file(pytest.shape_file)
     all_diff_perc = []
     for shp in shapes:
         prt_list = list(shp.shape.parts) + [len(shp.points)]
@@ -75,19 +92,25 @@ def calc_sphere_area_diff(points: np.ndarray):
 
 @pytest.mark.unit
 @pytest.mark.skipif('shapely' not in sys.modules, reason="requires the 'Shapely' library")
-def test_centroid_area_all_shapes():
-    """Testing the function for calculating shape centroid."""
-    shapes = ShapeView.from_file(pytest.shape_file)
+@pytest.mark.parametrize("shape_index", shape_indices())
+def test_centroid_area_all_shapes(shapes, shape_index):
+    """Testing the function for calculating shape centroid (one test per shape)."""
+    shp = shapes[shape_index]
+    prt_list = shp.part_offsets
 
-    for shp in shapes:
-        prt_list = list(shp.shape.parts) + [len(shp.points)]
-        for i in range(len(prt_list) - 1):
-            # Skip a known edge case (see "test_centroid_area_edge_case")
-            if shp.name == "AFRO:DRCONGO:HAUT_KATANGA:KAMPEMBA" and i == 1:
-                continue
+    # Expected centroids and areas of all parts (from Shapely, vectorized over parts)
+    part_ids = np.repeat(np.arange(len(prt_list) - 1), np.diff(prt_list))
+    polygons = shapely.polygons(shapely.linearrings(shp.points, indices=part_ids))
+    centroids = shapely.centroid(polygons)
+    expected = np.column_stack([shapely.get_x(centroids), shapely.get_y(centroids), shapely.area(polygons)])
 
-            points = shp.points[prt_list[i]:prt_list[i + 1]]
-            validate_centroid(points, places=4)
+    for i in range(len(prt_list) - 1):
+        # Skip a known edge case (see "test_centroid_area_edge_case")
+        if shp.name == "AFRO:DRCONGO:HAUT_KATANGA:KAMPEMBA" and i == 1:
+            continue
+
+        points = shp.points[prt_list[i]:prt_list[i + 1]]
+        assert_centroid(centroid_area(points), expected[i], places=4)
 
 
 @pytest.mark.unit
@@ -105,13 +128,16 @@ def test_centroid_area_edge_case():
 
 def validate_centroid(points, places=4):
     """Compare centroid coordinates and area with shapley."""
-    # actual centroid
-    x1, y1, a1 = centroid_area(points)
-
     # expected centroid (from Shapely)
     p = Polygon(points)
     c = p.centroid
-    x2, y2, a2 = c.xy[0][0], c.xy[1][0], p.area
+    assert_centroid(centroid_area(points), (c.x, c.y, p.area), places=places)
+
+
+def assert_centroid(actual, expected, places=4):
+    """Compare actual (x, y, signed area) and expected (x, y, area) centroids."""
+    x1, y1, a1 = actual
+    x2, y2, a2 = expected
 
     assert round(x1, places) == round(x2, places)
     assert round(y1, places) == round(y2, places)
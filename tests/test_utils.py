@@ -0,0 +1,63 @@
+import json
+import pytest
+import zipfile
+
+from rastertools import utils
+from pytest_init import change_test_dir  # don't remove
+
+
+@pytest.mark.unit
+def test_read_json_long_ints(tmp_path):
+    """Testing integers not fitting in 64 bits are read exactly, regardless of the JSON parser used."""
+    data = {"big": 2**70, "small": -2**63 - 1, "int64": 2**63 - 1, "float": 0.1}
+    json_path = tmp_path.joinpath("ints.json")
+    utils.save_json(data, json_path)
+    actual = utils.read_json(json_path)
+    assert actual["big"] == 2**70 and isinstance(actual["big"], int)
+    assert actual["small"] == -2**63 - 1 and isinstance(actual["small"], int)
+    assert actual["int64"] == 2**63 - 1
+    assert actual["float"] == 0.1
+
+
+@pytest.mark.unit
+def test_read_json_nan(tmp_path):
+    """Testing NaN values written by save_json are read back."""
+    json_path = tmp_path.joinpath("nan.json")
+    utils.save_json({"nan": float("nan")}, json_path)
+    assert json.dumps(utils.read_json(json_path)["nan"]) == "NaN"
+
+
+@pytest.mark.unit
+def test_read_json(tmp_path):
+    """Testing a regular JSON document is read the same as with the json module."""
+    data = {"a": [1, 2.5, -3], "b": {"c": "12345678901234567890"}, "d": None}
+    json_path = tmp_path.joinpath("regular.json")
+    utils.save_json(data, json_path)
+    assert utils.read_json(json_path) == data
+
+
+@pytest.mark.unit
+def test_extract_archive(tmp_path):
+    """Testing extraction of a ZIP archive with nested directories, with and without directory entries."""
+    file_path = tmp_path.joinpath("archive.zip")
+    members = {"a.txt": "a", "sub/b.txt": "b", "sub/deep/c.txt": "c", "other/deep/d.txt": "d",
+               "x/../../y/e.txt": "e", "/abs/f.txt": "f"}
+    # Members are extracted to sanitized paths ("." and ".." components and leading slashes dropped)
+    paths = {"x/../../y/e.txt": "x/y/e.txt", "/abs/f.txt": "abs/f.txt"}
+    with zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("sub/", "")  # directory entries
+        zf.writestr("empty/", "")
+        for name, content in members.items():
+            zf.writestr(name, content * 1000)
+
+    extracted_files = utils.extract_archive(file_path)
+
+    dst_dir = tmp_path.joinpath("archive")
+    assert extracted_files == [str(dst_dir.joinpath(paths.get(name, name))) for name in members]
+    for name, content in members.items():
+        assert dst_dir.joinpath(paths.get(name, name)).read_text() == content * 1000
+    assert dst_dir.joinpath("empty").is_dir()
+    actual_tree = sorted(p.relative_to(dst_dir).as_posix() for p in dst_dir.rglob("*"))
+    assert actual_tree == ["a.txt", "abs", "abs/f.txt", "empty", "other", "other/deep", "other/deep/d.txt",
+                           "sub", "sub/b.txt", "sub/deep", "sub/deep/c.txt", "x", "x/y", "x/y/e.txt"]
+    assert not tmp_path.joinpath("y").exists()